@@ -1,10 +1,12 @@
 import gzip
+import io
 import sys
 import tkinter as tk
 import shutil  # <-- I use shutil.rmtree() to remove chunk folders
 import requests
 import platform
 import subprocess
+import numpy as np
 import pandas as pd
 import xml.etree.ElementTree as ET
 import threading
@@ -12,6 +14,8 @@ from threading import Thread, Lock
 import webbrowser  # <-- for opening social media links
 import csv
 import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, CancelledError
 from tkinter import filedialog
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
@@ -19,6 +23,7 @@ from tkinter import StringVar  # Import StringVar
 import time
 from datetime import datetime, timedelta
 import json
+import hashlib
 import os
 import re
 import math
@@ -27,296 +32,580 @@ from tkinter import messagebox
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from tkinter import filedialog, StringVar, messagebox, BooleanVar
 import urllib.parse
+from urllib3.util.retry import Retry
+
+try:
+    import rapidgzip  # Optional: parallel gzip decompression for large dumps
+except ImportError:
+    rapidgzip = None
+
+try:
+    from isal import igzip as isal_gzip  # Optional: ISA-L (SIMD) inflate, drop-in for gzip
+except ImportError:
+    isal_gzip = None
+
+try:
+    from lxml import etree as lxml_etree  # Optional: C-level XML parsing
+except ImportError:
+    lxml_etree = None
+
+try:
+    import pyarrow as pa  # Optional: C++ JSON reader, Arrow strings, Parquet
+    import pyarrow.json as pa_json
+except ImportError:
+    pa = None
+
+# Text columns of the listing table: Arrow-backed strings (one UTF-8 buffer per
+# column instead of a Python str per cell) when pyarrow is installed
+LISTING_STR_DTYPE = "string[pyarrow]" if pa is not None else object
+# Downloaded/Extracted/Processed: two-glyph categorical, one int8 code per row;
+# cells still read and compare as "✖"/"✔"
+STATUS_DTYPE = pd.CategoricalDtype(["✖", "✔"])
+
+# Single-stream downloads push progress to Tk once DOWNLOAD_UI_INTERVAL seconds
+# have passed or DOWNLOAD_UI_MIN_BYTES more bytes arrived, not per read
+DOWNLOAD_UI_INTERVAL = 0.2
+DOWNLOAD_UI_MIN_BYTES = 8 << 20
+
+# Parallel downloads record each segment's progress after this many new bytes
+DOWNLOAD_CHECKPOINT_BYTES = 8 << 20
+
+# Response bodies are read DOWNLOAD_READ_SIZE at a time and written through a
+# DOWNLOAD_WRITE_BUFFER-sized file buffer (fewer loop iterations and write syscalls)
+DOWNLOAD_READ_SIZE = 1 << 20
+DOWNLOAD_WRITE_BUFFER = 4 << 20
+
+# The console keeps at most CONSOLE_MAX_LINES lines; the oldest CONSOLE_TRIM_LINES
+# (an even count, so the alternating colours stay in step) are dropped at once
+CONSOLE_MAX_LINES = 2000
+CONSOLE_TRIM_LINES = 500
+# The status-bar log preview is refreshed at most this often (ms)
+SCROLL_MESSAGE_INTERVAL_MS = 200
+
+# Read size used when extracting through rapidgzip (its parallel chunk size)
+RAPIDGZIP_CHUNK_MIB = 4
+# Read size for gzip/isal extraction, and the progress step (in tenths of a
+# percent) below which no new progress message is queued
+EXTRACT_READ_SIZE = 8 << 20
+EXTRACT_PROGRESS_STEP = 5
+# .gz files extracted at the same time when inflating is single-threaded
+# (isal/gzip/pigz -d); rapidgzip already spreads one file over all cores
+EXTRACT_PARALLEL_FILES = min(4, os.cpu_count() or 1)
+
 ###############################################################################
 #                              XML → DataFrame logic
 ###############################################################################
 
+# Compiled once; sanitize_line runs for every record of multi-GB dumps
+INVALID_XML_CHARS_RE = re.compile(r'[^\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD]')
+BARE_AMPERSAND_RE = re.compile(r'&(?![a-zA-Z0-9#]+;)')
+
+
 def sanitize_line(line: str) -> str:
     """
     Removes invalid XML chars and replaces bare '&' with &amp;.
     """
-    line = re.sub(r'[^\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD]', '', line)
-    line = re.sub(r'&(?![a-zA-Z0-9#]+;)', '&amp;', line)
+    line = INVALID_XML_CHARS_RE.sub('', line)
+    line = BARE_AMPERSAND_RE.sub('&amp;', line)
     return line
 
-def chunk_xml_by_type(xml_file: Path, content_type: str, records_per_file=10000, logger=None):
+
+# Bytes that may follow "<tag" when it really is that tag (not e.g. <releases>)
+TAG_NAME_END = frozenset(b" \t\r\n>/")
+RAW_SCAN_BLOCK_SIZE = 4 << 20  # 4 MiB
+
+
+def iter_raw_record_batches(f, record_tag: str, block_size=RAW_SCAN_BLOCK_SIZE):
     """
-    A purely line-based chunker for old Discogs dumps that have no single root.
-    No ElementTree usage => no 'junk after document element'.
-    We just scan for <artist>...</artist>, <label>...</label>, or <release>...</release>.
-
-    :param xml_file: the path to the old .xml
-    :param content_type: e.g. 'artists', 'labels', or 'releases'
-    :param records_per_file: how many <record_tag> blocks per chunk
-    :param logger: optional logging function
+    Byte-level scan of a binary stream for <record_tag ...>...</record_tag> records.
+    Reads block_size blocks and locates markers with bytes.find; nothing is decoded
+    or parsed. Same-named nested tags (e.g. <label> inside <sublabels>) are
+    depth-counted, so they don't end the record early.
+
+    Yields (records, bytes_read): the raw bytes of every record completed in the
+    latest block and the number of bytes consumed from f so far.
     """
-    record_tag = content_type[:-1].lower()  # 'artists'->'artist', 'labels'->'label', 'releases'->'release'
-    start_pat = re.compile(fr'<{record_tag}\b', re.IGNORECASE)
-    end_pat   = re.compile(fr'</{record_tag}>', re.IGNORECASE)
+    start_tok = b"<" + record_tag.encode()
+    end_tok = b"</" + record_tag.encode() + b">"
+    start_len = len(start_tok)
+    end_len = len(end_tok)
+
+    def find_start(buf, pos):
+        # Next real "<record_tag" at or after pos; -1 if none, -2 if cut by the block end
+        while True:
+            i = buf.find(start_tok, pos)
+            if i == -1:
+                return -1
+            if i + start_len >= len(buf):
+                return -2
+            if buf[i + start_len] in TAG_NAME_END:
+                return i
+            pos = i + 1
+
+    def is_self_closing(buf, i):
+        # True/False for the tag opening at i; None if its '>' is not in buf yet
+        gt = buf.find(b">", i)
+        if gt == -1:
+            return None
+        return buf[gt - 1] == 0x2F  # '/'
+
+    buf = b""
+    bytes_read = 0
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        bytes_read += len(block)
+        buf = buf + block if buf else block
+
+        records = []
+        pos = 0
+        while True:
+            start = find_start(buf, pos)
+            if start == -1:
+                # Nothing left but the tail of a possible marker
+                pos = max(pos, len(buf) - start_len)
+                break
+            if start == -2:
+                pos = len(buf) - start_len
+                break
+
+            closing = is_self_closing(buf, start)
+            if closing is None:
+                pos = start
+                break
+            if closing:
+                end = buf.find(b">", start) + 1
+            else:
+                # Depth-count nested same-named tags until the matching end tag
+                depth = 1
+                p = start + start_len
+                end = -1
+                while True:
+                    e = buf.find(end_tok, p)
+                    if e == -1:
+                        break
+                    n = find_start(buf, p)
+                    if n == -2:
+                        break
+                    if n != -1 and n < e:
+                        nested_closing = is_self_closing(buf, n)
+                        if nested_closing is None:
+                            break
+                        if not nested_closing:
+                            depth += 1
+                        p = n + start_len
+                        continue
+                    depth -= 1
+                    p = e + end_len
+                    if depth == 0:
+                        end = p
+                        break
+                if end == -1:
+                    pos = start  # Record continues in the next block
+                    break
 
-    chunk_folder = xml_file.parent / f"chunked_{content_type}"
-    chunk_folder.mkdir(exist_ok=True)
+            records.append(buf[start:end])
+            pos = end
 
-    if logger:
-        logger(f"[LINE-BASED] Chunking '{xml_file.name}' for <{record_tag}> blocks.", "INFO")
+        buf = buf[pos:]
+        if records:
+            yield records, bytes_read
 
-    chunk_count = 0
-    record_count = 0
-    inside_record = False
-    buffer_lines = []
-    current_chunk_file = None
-
-    def open_new_chunk():
-        nonlocal chunk_count, current_chunk_file, record_count
-        chunk_count += 1
-        chunk_path = chunk_folder / f"chunk_{str(chunk_count).zfill(6)}.xml"
-        current_chunk_file = open(chunk_path, 'w', encoding='utf-8')
-        current_chunk_file.write(f'<?xml version=\"1.0\" encoding=\"utf-8\"?>\n<{content_type}>\n')
-        record_count = 0
-        if logger:
-            logger(f"Created new chunk: {chunk_path.name}", "INFO")
-        else:
-            print(f"Created new chunk: {chunk_path.name}")
-
-    def close_chunk():
-        nonlocal current_chunk_file
-        if current_chunk_file:
-            current_chunk_file.write(f"</{content_type}>")
-            current_chunk_file.close()
-            current_chunk_file = None
-
-    # Start the first chunk
-    open_new_chunk()
-
-    with xml_file.open('r', encoding='utf-8', errors='ignore') as f:
-        for raw_line in f:
-            line = sanitize_line(raw_line)
-
-            if not inside_record:
-                # Check if line has <artist> or <label> or <release>
-                if start_pat.search(line):
-                    inside_record = True
-                    buffer_lines = [line]
-            else:
-                # We are inside a record block, keep collecting
-                buffer_lines.append(line)
-                if end_pat.search(line):
-                    # Found closing tag
-                    record_xml = ''.join(buffer_lines)
-                    current_chunk_file.write(record_xml + '\n')
-                    record_count += 1
-                    inside_record = False
-                    buffer_lines = []
-
-                    if record_count >= records_per_file:
-                        close_chunk()
-                        open_new_chunk()
-
-    close_chunk()
 
-    if logger:
-        logger(f"[LINE-BASED] Finished. Created {chunk_count} chunk(s).", "INFO")
-    else:
-        print(f"[LINE-BASED] Chunking complete. {chunk_count} chunk(s) in {chunk_folder}")
+def iter_record_blocks(xml_file: Path, record_tag: str):
+    """
+    Scan of a Discogs dump for <record_tag>...</record_tag> blocks
+    (iter_raw_record_batches). Works on old dumps without a single root,
+    since nothing is parsed here; only the found records are decoded and
+    sanitized, instead of every line of the file.
+
+    A downloaded .xml.gz is read through open_dump(), without extracting it first.
+
+    Yields (record_xml, bytes_read) where bytes_read is the position in
+    xml_file on disk (the compressed offset for a .gz) after the block's
+    read, for progress reporting.
+    """
+    f, position = open_dump(xml_file)
+    with f:
+        for records, _ in iter_raw_record_batches(f, record_tag):
+            bytes_read = position()
+            for record in records:
+                yield sanitize_line(record.decode('utf-8', errors='ignore')), bytes_read
+        if rapidgzip is not None and xml_file.suffix == ".gz":
+            save_rapidgzip_index(f, xml_file)
+
+
+def rapidgzip_index_path(gz_path: Path) -> Path:
+    """Where the rapidgzip block index of gz_path is kept (next to the .gz)."""
+    return gz_path.with_name(gz_path.name + ".gzindex")
+
+
+def open_rapidgzip(gz_path: Path):
+    """
+    Opens gz_path with rapidgzip on all cores. If a block index saved by an
+    earlier full read is present (and not older than the .gz), it is imported
+    so decompression starts in parallel right away instead of searching for
+    deflate block boundaries again.
+    """
+    f = rapidgzip.open(str(gz_path), parallelization=os.cpu_count() or 1)
+    index_path = rapidgzip_index_path(gz_path)
+    try:
+        if index_path.stat().st_mtime >= gz_path.stat().st_mtime:
+            f.import_index(str(index_path))
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass  # Corrupt/incompatible index: this read simply rebuilds it
+    return f
+
+
+def save_rapidgzip_index(f, gz_path: Path):
+    """Exports the block index of a fully read rapidgzip file for later runs (best effort)."""
+    index_path = rapidgzip_index_path(gz_path)
+    try:
+        if index_path.exists() and index_path.stat().st_mtime >= gz_path.stat().st_mtime:
+            return
+        if f.block_offsets_complete():
+            f.export_index(str(index_path))
+    except Exception:
+        index_path.unlink(missing_ok=True)
+
+
+def open_dump(path: Path):
+    """
+    Opens a Discogs dump for binary reading. A .gz dump is decompressed on the
+    fly (rapidgzip when installed, otherwise isal's or the stdlib gzip behind a
+    1 MiB read buffer), so it never has to be extracted to disk first.
+
+    Returns (f, position): position() is how far into the file on disk reading
+    has got, i.e. the compressed offset for a .gz (same probes as extraction).
+    """
+    if path.suffix != ".gz":
+        f = path.open('rb')
+        return f, f.tell
+    if rapidgzip is not None:
+        f = open_rapidgzip(path)
+        return f, lambda: f.tell_compressed() // 8  # reported in bits
+    raw = open(path, 'rb')
+    advise_sequential(raw.fileno())
+    gz = (isal_gzip or gzip).GzipFile(fileobj=raw, mode='rb')
+    gz.myfileobj = raw  # GzipFile closes it together with itself
+    return io.BufferedReader(gz, buffer_size=1 << 20), raw.tell
 
 
 ###############################################################################
-#                  STREAMING: Two-pass approach for each chunk
+#                  Record events → column names / CSV rows
 ###############################################################################
-def update_columns_from_chunk(chunk_file_path: Path, all_columns: set, record_tag: str, logger=None):
+def drop_finished_siblings(elem, root=None):
     """
-    1. Pass: Parse the chunk file line by line.
-       - Add discovered tag/attribute names to the 'all_columns' set.
-       - No data is stored in memory.
+    Parsers keep cleared elements attached to their parent; drop the finished
+    ones so memory stays bounded by one record instead of the whole file.
+    lxml: delete the siblings before elem. ElementTree elements have no
+    getprevious(), so the document root (captured by the caller on its first
+    start event) is cleared instead.
     """
-    current_path = []
-    for event, elem in ET.iterparse(str(chunk_file_path), events=("start", "end")):
-        if event == "start":
-            current_path.append(elem.tag)
-            # Discover attributes
-            for attr, value in elem.attrib.items():
-                if len(current_path) >= 3:
-                    # Two levels deep
-                    parent_tag = current_path[-3]
-                    current_tag = current_path[-2]
-                    tag_name = f"{parent_tag}_{current_tag}_{elem.tag}_{attr}"
-                elif len(current_path) == 2:
-                    # One level deep
-                    tag_name = f"{current_path[-2]}_{elem.tag}_{attr}"
-                else:
-                    # Root or unexpected depth
-                    tag_name = f"{elem.tag}_{attr}"
-                all_columns.add(tag_name)
-        elif event == "end":
-            if elem.text and not elem.text.isspace():
-                if len(current_path) >= 3:
-                    # Two levels deep
-                    parent_tag = current_path[-3]
-                    current_tag = current_path[-2]
-                    tag_name = f"{parent_tag}_{current_tag}_{elem.tag}"
-                elif len(current_path) == 2:
-                    # One level deep
-                    tag_name = f"{current_path[-2]}_{elem.tag}"
-                else:
-                    # Root or unexpected depth
-                    tag_name = elem.tag
-                all_columns.add(tag_name)
-
-            if elem.tag == record_tag:
-                # Record ended, do nothing except ensure we clear
-                pass
+    if not hasattr(elem, "getprevious"):
+        if root is not None and root is not elem:
+            root.clear()
+        return
+    parent = elem.getparent()
+    while elem.getprevious() is not None:
+        del parent[0]
 
-            current_path.pop()
-            elem.clear()
 
-    if logger:
-        logger(f"Updated columns from {chunk_file_path.name}. Total columns now: {len(all_columns)}", "INFO")
+def column_path_entry(parent, tag, record_tag=None):
+    """
+    Column names for <tag> under parent (the parent's entry, or DOCUMENT_ENTRY
+    for the root), as (text column, "<parent tag>_<tag>" prefix for children,
+    tag, child entries, attribute columns, is-record flag).
+
+    Same naming as before: "<grandparent>_<parent>_<tag>" two levels deep,
+    "<parent>_<tag>" one level deep, "<tag>" at the root; attributes append "_<attr>".
+    Entries are cached in the parent's child dict, so every name is built once
+    per distinct path instead of once per parse event, and the record check is
+    decided once per path as well.
+    """
+    tag = sys.intern(tag)
+    if parent[2] is None:
+        name = pair = tag
     else:
-        print(f"Updated columns from {chunk_file_path.name}. Total columns now: {len(all_columns)}")
+        name = sys.intern(parent[1] + "_" + tag)
+        pair = sys.intern(parent[2] + "_" + tag)
+    return name, pair, tag, {}, {}, tag == record_tag
+
+
+def new_document_entry():
+    """Stack sentinel above the root element; its child dict holds the root entries."""
+    return None, None, None, {}, None, False
+
+
+CSV_WRITE_BATCH = 1000
 
 
-def write_chunk_to_csv(chunk_file_path: Path, csv_writer: csv.DictWriter, all_columns: list, record_tag: str,
-                       logger=None):
+def record_to_row(record_data: dict, col_index: dict) -> list:
+    """Places a record's values at their column positions; nested values become JSON strings."""
+    row = [None] * len(col_index)
+    for col, value in record_data.items():
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        row[col_index[col]] = value
+    return row
+
+
+def write_rows_batched(csv_writer, records, all_columns: list):
     """
-    2. Pass: Parse the chunk file line by line.
-             For each <record_tag>...</record_tag> record, write a single row to the CSV.
-             Nested tags are serialized as JSON strings.
+    Writes records as list rows through a plain csv.writer, CSV_WRITE_BATCH rows
+    per writerows() call, instead of one DictWriter.writerow() per record.
     """
-    current_path = []
-    record_data = {}
-    nested_data = {}
+    col_index = {col: i for i, col in enumerate(all_columns)}
+    buf = []
+    for record_data in records:
+        buf.append(record_to_row(record_data, col_index))
+        if len(buf) >= CSV_WRITE_BATCH:
+            csv_writer.writerows(buf)
+            buf.clear()
+    if buf:
+        csv_writer.writerows(buf)
+
+
+def iter_records_from_events(events, record_tag: str):
+    """
+    Assembles ("start", "end") parse events into one {column: value} dict per
+    <record_tag>. Repeated tags/attributes become lists. The yielded dict is
+    reused, so consume it before advancing the generator.
 
-    for event, elem in ET.iterparse(str(chunk_file_path), events=("start", "end")):
+    This loop runs once per parse event, so it reads elem.text once, takes the
+    column names from the cached column_path_entry() of each open element and
+    binds the stack methods to locals.
+    """
+    path_stack = [new_document_entry()]
+    root = None
+    push_entry = path_stack.append
+    pop_entry = path_stack.pop
+    record_data = {}  # One dict, reused for every record
+
+    for event, elem in events:
         if event == "start":
-            current_path.append(elem.tag)
+            tag = elem.tag
+            children = path_stack[-1][3]
+            entry = children.get(tag)
+            if entry is None:
+                entry = children[tag] = column_path_entry(path_stack[-1], tag, record_tag)
+                if len(path_stack) == 1:
+                    root = elem
+            push_entry(entry)
+            attrib = elem.attrib
+            if not attrib:
+                continue
             # Save attributes
-            for attr, value in elem.attrib.items():
-                if len(current_path) >= 3:
-                    # Two levels deep
-                    parent_tag = current_path[-3]
-                    current_tag = current_path[-2]
-                    tag_name = f"{parent_tag}_{current_tag}_{elem.tag}_{attr}"
-                elif len(current_path) == 2:
-                    # One level deep
-                    tag_name = f"{current_path[-2]}_{elem.tag}_{attr}"
-                else:
-                    # Root or unexpected depth
-                    tag_name = f"{elem.tag}_{attr}"
+            attr_names = entry[4]
+            for attr, value in attrib.items():
+                tag_name = attr_names.get(attr)
+                if tag_name is None:
+                    tag_name = attr_names[attr] = sys.intern(entry[0] + "_" + attr)
                 # Handle multiple attributes by storing in lists
-                if tag_name in nested_data:
-                    if isinstance(nested_data[tag_name], list):
-                        nested_data[tag_name].append(value)
-                    else:
-                        nested_data[tag_name] = [nested_data[tag_name], value]
-                else:
-                    nested_data[tag_name] = value
-
-        elif event == "end":
-            if elem.text and not elem.text.isspace():
-                if len(current_path) >= 3:
-                    # Two levels deep
-                    parent_tag = current_path[-3]
-                    current_tag = current_path[-2]
-                    tag_name = f"{parent_tag}_{current_tag}_{elem.tag}"
-                elif len(current_path) == 2:
-                    # One level deep
-                    tag_name = f"{current_path[-2]}_{elem.tag}"
+                existing = record_data.get(tag_name)
+                if existing is None:
+                    record_data[tag_name] = value
+                elif isinstance(existing, list):
+                    existing.append(value)
                 else:
-                    # Root or unexpected depth
-                    tag_name = elem.tag
+                    record_data[tag_name] = [existing, value]
+
+        else:  # "end"
+            entry = pop_entry()
+            text = elem.text
+            if text and not text.isspace():
+                tag_name = entry[0]
                 # Handle multiple tags by storing in lists
-                if tag_name in nested_data:
-                    if isinstance(nested_data[tag_name], list):
-                        nested_data[tag_name].append(elem.text.strip())
-                    else:
-                        nested_data[tag_name] = [nested_data[tag_name], elem.text.strip()]
+                text = text.strip()
+                existing = record_data.get(tag_name)
+                if existing is None:
+                    record_data[tag_name] = text
+                elif isinstance(existing, list):
+                    existing.append(text)
                 else:
-                    nested_data[tag_name] = elem.text.strip()
-
-            if elem.tag == record_tag:
-                # Record completed, write to CSV
-                # Merge nested_data into current_record
-                for key, value in nested_data.items():
-                    if key in record_data:
-                        if isinstance(record_data[key], list):
-                            record_data[key].append(value)
-                        else:
-                            record_data[key] = [record_data[key], value]
-                    else:
-                        record_data[key] = value
-
-                # Serialize nested structures as JSON strings
-                row_to_write = {}
-                for col in all_columns:
-                    value = record_data.get(col, None)
-                    if isinstance(value, (dict, list)):
-                        row_to_write[col] = json.dumps(value)
-                    else:
-                        row_to_write[col] = value
-                csv_writer.writerow(row_to_write)
+                    record_data[tag_name] = [existing, text]
+
+            if entry[5]:
+                # Record completed, hand it to the writer
+                yield record_data
                 record_data.clear()
-                nested_data.clear()
 
-            current_path.pop()
-            elem.clear()
+                elem.clear()
+                drop_finished_siblings(elem, root)
+            else:
+                elem.clear()
 
-    if logger:
-        logger(f"Written data from {chunk_file_path.name} to CSV.", "INFO")
+
+# Prebuilt encoders: json.dumps would set up its arguments on every call.
+# Nested values keep json.dumps' default escaping since they end up in the CSV;
+# staged lines are only read back by this module, so they stay raw UTF-8.
+encode_nested_value = json.JSONEncoder(check_circular=False).encode
+encode_staged_record = json.JSONEncoder(ensure_ascii=False, check_circular=False).encode
+
+
+def stage_records(records, staging_file: Path, all_columns: set):
+    """
+    Single-pass helper: writes every record as a JSON line to staging_file and
+    collects the column names on the way, so the XML is parsed only once.
+    Nested structures are serialized as JSON strings here, so every staged line
+    is a flat {column: string} object.
+    """
+    with open(staging_file, "a", encoding="utf-8", buffering=1 << 20) as f:
+        for record_data in records:
+            all_columns.update(record_data)
+            for col, value in record_data.items():
+                if isinstance(value, (dict, list)):
+                    record_data[col] = encode_nested_value(value)
+            f.write(encode_staged_record(record_data))
+            f.write("\n")
+
+
+def write_staged_records_to_csv(staging_file: Path, output_csv: Path, all_columns: list, progress_cb=None,
+                                write_header=True):
+    """
+    Emits the JSON lines of stage_records() as CSV rows under the final header.
+    With pyarrow, the lines are parsed as Arrow RecordBatches instead of one
+    json.loads() per line; either way header and rows go through the same
+    csv.writer, so quoting and line endings don't depend on pyarrow.
+    progress_cb(fraction) is called every 10000 rows with the share of staging_file read.
+    write_header=False writes only the rows (partial CSVs that are concatenated later).
+    """
+    staging_size = staging_file.stat().st_size
+    with open(staging_file, "rb") as f_in, \
+            open(output_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(all_columns)
+
+        if pa is not None and hasattr(pa_json, "open_json") and staging_size:
+            write_staged_records_arrow(f_in, writer, all_columns,
+                                       lambda: progress_cb(f_in.tell() / staging_size) if progress_cb else None)
+            return
+
+        def staged_records():
+            for row_count, line in enumerate(f_in, 1):
+                yield json.loads(line)
+                if progress_cb and row_count % 10000 == 0:
+                    progress_cb(f_in.tell() / staging_size)
+
+        write_rows_batched(writer, staged_records(), all_columns)
+
+
+ARROW_BLOCK_SIZE = 4 << 20  # 4 MiB of JSON lines per RecordBatch
+
+
+def write_staged_records_arrow(f_in, csv_writer, all_columns: list, on_batch=None):
+    """
+    Reads the flat JSON lines of stage_records() as string RecordBatches
+    (missing columns -> null -> empty field) and hands their rows to
+    csv_writer, one writerows() call per batch. on_batch() runs after each batch.
+    pyarrow's own CSV writer is not used: it quotes every string value.
+    """
+    schema = pa.schema([(col, pa.string()) for col in all_columns])
+    reader = pa_json.open_json(
+        f_in,
+        read_options=pa_json.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=pa_json.ParseOptions(explicit_schema=schema, unexpected_field_behavior="error"),
+    )
+    for batch in reader:
+        csv_writer.writerows(zip(*(column.to_pylist() for column in batch.columns)))
+        if on_batch:
+            on_batch()
+
+
+###############################################################################
+#              STREAMING: XML → CSV without intermediate chunk files
+###############################################################################
+def iter_record_events(xml_file: Path, content_type: str, records_per_batch=10000, progress_cb=None):
+    """
+    Feeds the record blocks of xml_file to an XMLPullParser under a synthetic
+    <content_type> root and yields its ("start", "end") events for
+    iter_records_from_events(). Uses lxml's parser (huge_tree,
+    recover) when lxml is installed, otherwise ElementTree's.
+
+    Records are fed one at a time and their events read right away, so only
+    one record's elements are alive at once (big feeds leave hundreds of
+    thousands of live elements behind and make the GC thrash).
+
+    :param records_per_batch: how many records between root pruning / progress reports
+    :param progress_cb: optional progress_cb(bytes_read), called after each batch
+    """
+    record_tag = content_type[:-1].lower()
+    if lxml_etree is not None:
+        parser = lxml_etree.XMLPullParser(events=("start", "end"), huge_tree=True, recover=True)
     else:
-        print(f"Written data from {chunk_file_path.name} to CSV.")
+        parser = ET.XMLPullParser(events=("start", "end"))
+    parser.feed(f"<{content_type}>")
+    root = None
+    record_count = 0
+
+    for record_xml, bytes_read in iter_record_blocks(xml_file, record_tag):
+        parser.feed(record_xml)
+        for event, elem in parser.read_events():
+            if root is None:
+                root = elem
+            yield event, elem
+
+        record_count += 1
+        if record_count % records_per_batch == 0:
+            # Finished records are already cleared; drop them from the root as well
+            root.clear()
+            if progress_cb:
+                progress_cb(bytes_read)
+
+    parser.feed(f"</{content_type}>")
+    yield from parser.read_events()
+    parser.close()
 
 
-def convert_chunked_files_to_csv(
-    chunk_folder: Path,
+def convert_xml_to_csv(
+    xml_file: Path,
     output_csv: Path,
     content_type: str,
+    records_per_batch=10000,
     logger=None,
     progress_cb=None  # Callback for progress updates
 ):
     """
-    1) Discover columns across all chunk files (pass 1).
-    2) Write all chunk files to CSV (pass 2).
-    If progress_cb(current_step, total_steps) is provided,
-    it will be called after each chunk is processed.
+    Streams a dump straight into a CSV, without a chunked_<content>/ folder.
+    xml_file is the extracted .xml or the downloaded .xml.gz (decompressed on the fly).
+    1) Parse the XML once, staging records as JSON lines and collecting the columns.
+    2) Write the staged records to CSV under the final (sorted) header.
+    If progress_cb(current_step, total_steps) is provided, it is called
+    after each batch of records; the XML pass covers the first half of the steps.
     """
-    import csv
     record_tag = content_type[:-1]  # "releases" -> "release"
-    chunk_files = sorted(chunk_folder.glob("chunk_*.xml"))
-    if not chunk_files:
+    total_size = xml_file.stat().st_size
+    total_steps = 2 * total_size
+    staging_file = output_csv.with_suffix(".records.tmp")
+    staging_file.unlink(missing_ok=True)
+
+    def xml_progress(bytes_read):
+        progress_cb(bytes_read, total_steps)
+
+    def staged_progress(fraction):
+        progress_cb(total_size + int(fraction * total_size), total_steps)
+
+    try:
+        # 1) PASS: Parse XML, stage records, discover columns
+        all_columns = set()
+        events = iter_record_events(xml_file, content_type, records_per_batch,
+                                    xml_progress if progress_cb else None)
+        stage_records(iter_records_from_events(events, record_tag), staging_file, all_columns)
+        # Sorted header: stable across runs and dumps (a one-off sort of a few dozen names)
+        all_columns = sorted(all_columns)
         if logger:
-            logger(f"[WARNING] No chunk_*.xml files found in {chunk_folder}", "WARNING")
-        else:
-            print(f"[WARNING] No chunk_*.xml files found in {chunk_folder}")
-        return
-
-    # 1) PASS: Discover columns
-    total_chunks = len(chunk_files)
-    current_step = 0
-    all_columns = set()
-
-    # Total steps: PASS 1 + PASS 2 = 2 * total_chunks
-    total_steps = 2 * total_chunks
-
-    for cf in chunk_files:
-        update_columns_from_chunk(cf, all_columns, record_tag=record_tag, logger=logger)
-        current_step += 1
-
-        # Update progress bar after each chunk
-        if progress_cb:
-            progress_cb(current_step, total_steps)
+            logger(f"Discovered {len(all_columns)} columns in {xml_file.name}", "INFO")
 
-    all_columns = sorted(all_columns)  # Keep columns ordered
-
-    # 2) PASS: Write to CSV
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=all_columns)
-        writer.writeheader()
-
-        for cf in chunk_files:
-            write_chunk_to_csv(cf, writer, all_columns, record_tag=record_tag, logger=logger)
-            current_step += 1
-            if progress_cb:
-                progress_cb(current_step, total_steps)
+        # 2) PASS: Write staged records to CSV
+        staging_file.touch()
+        write_staged_records_to_csv(staging_file, output_csv, all_columns,
+                                    staged_progress if progress_cb else None)
+    finally:
+        staging_file.unlink(missing_ok=True)
 
     if logger:
         logger(f"Done! Created CSV: {output_csv}", "INFO")
@@ -324,6 +613,29 @@ def convert_chunked_files_to_csv(
         print(f"[INFO] Done! Created CSV: {output_csv}")
 
 
+def process_content_type(xml_file: Path, output_csv: Path, content_type: str, progress_queue=None):
+    """
+    Process-pool entry point: converts one extracted dump in its own process, so
+    several content types convert in parallel instead of sharing one GIL.
+    Takes no Tk state; log lines and progress go back through progress_queue
+    (a multiprocessing.Manager queue) as ('log', (message, level)) and
+    ('conversion_progress', (xml_file.name, percent)).
+    """
+    def logger(message, level="INFO"):
+        if progress_queue is not None:
+            progress_queue.put(('log', (message, level)))
+        else:
+            print(f"[{level}] {message}")
+
+    def progress_cb(current_step, total_steps):
+        percent = (current_step / total_steps) * 100 if total_steps else 0
+        progress_queue.put(('conversion_progress', (xml_file.name, percent)))
+
+    convert_xml_to_csv(xml_file, output_csv, content_type, logger=logger,
+                       progress_cb=progress_cb if progress_queue is not None else None)
+    return output_csv
+
+
 ###############################################################################
 #                             S3 + UI + Main Logic
 ###############################################################################
@@ -338,17 +650,103 @@ else:
 PATH = BASE_DIR / 'assets'
 
 
+# (shift, unit) by bit length: < 2**10 -> B, < 2**20 -> KB, < 2**30 -> MB, else GB
+SIZE_UNITS = ((0, "B"), (10, "KB"), (20, "MB"), (30, "GB"))
+
+
+def new_download_session(pool_size=8):
+    """requests.Session whose connection pool fits pool_size concurrent range requests."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def human_readable_size(num_bytes):
     """Convert a file size in bytes to a human-readable string (KB, MB, or GB),
        with 0 digits after the decimal."""
-    if num_bytes < 1024:
-        return f"{num_bytes} B"
-    elif num_bytes < 1024 ** 2:
-        return f"{num_bytes // 1024} KB"
-    elif num_bytes < 1024 ** 3:
-        return f"{num_bytes // (1024 ** 2)} MB"
-    else:
-        return f"{num_bytes // (1024 ** 3)} GB"
+    num_bytes = int(num_bytes)
+    shift, unit = SIZE_UNITS[min((num_bytes.bit_length() - 1) // 10, 3)] if num_bytes > 0 else SIZE_UNITS[0]
+    return f"{num_bytes >> shift} {unit}"
+
+
+def advise_sequential(fd):
+    """Tell the kernel fd is read front to back (bigger read-ahead). No-op without posix_fadvise."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def drop_from_page_cache(path: Path):
+    """
+    Ask the kernel to evict path's cached pages: a dump read once for
+    extraction would otherwise keep gigabytes of page cache busy.
+    No-op without posix_fadvise (macOS, Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def process_read_position(pid, path: Path):
+    """
+    Linux only: current offset of process pid's open handle on path, read from
+    /proc/<pid>/fdinfo. None when the process or the handle is not there (yet).
+    """
+    target = str(path.resolve())
+    fd_dir = f"/proc/{pid}/fd"
+    try:
+        for fd in os.listdir(fd_dir):
+            if os.readlink(f"{fd_dir}/{fd}") == target:
+                with open(f"/proc/{pid}/fdinfo/{fd}") as f:
+                    for line in f:
+                        if line.startswith("pos:"):
+                            return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def gzip_uncompressed_size(path: Path, compressed_size):
+    """
+    Uncompressed size from the gzip ISIZE trailer (last 4 bytes), or None when it
+    cannot be trusted: ISIZE is stored modulo 2**32, so past 4 GB of compressed
+    input it has certainly wrapped, and a value not above the compressed size
+    means it wrapped (or the file is odd) as well.
+    """
+    if compressed_size < 18 or compressed_size >= 1 << 32:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            f.seek(-4, os.SEEK_END)
+            isize = int.from_bytes(f.read(4), 'little')
+    except OSError:
+        return None
+    return isize if isize > compressed_size else None
+
+
+def drain_queue(q):
+    """Take every pending message off a queue.Queue with a single lock acquisition."""
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        q.not_full.notify_all()
+    return items
+
+
+KEY_DATE_RE = re.compile(r'discogs_(\d{8})_')
 
 
 def extract_date_from_key(key):
@@ -356,7 +754,7 @@ def extract_date_from_key(key):
     Verilen key içerisindeki 'discogs_YYYYMMDD_' desenini yakalar.
     Örneğin: "data/2017/discogs_20170101_artists.xml.gz"
     """
-    m = re.search(r'discogs_(\d{8})_', key)
+    m = KEY_DATE_RE.search(key)
     if m:
         date_str = m.group(1)  # Örneğin "20170101"
         try:
@@ -373,62 +771,270 @@ def get_month_from_key(key):
     dt = extract_date_from_key(key)
     return dt.strftime("%Y-%m") if dt else ""
 
-def list_directories_from_s3(base_url="https://data.discogs.com/", prefix="data/"):
+
+def fetch_expected_sha256(file_url, session=None):
+    """
+    Discogs her dump ayı için discogs_YYYYMMDD_CHECKSUM.txt yayınlar
+    ("<sha256> <dosya adı>" satırları). file_url için beklenen SHA256'yı döner;
+    checksum dosyası alınamazsa ya da dosya listede yoksa None.
+
+    file_url, parse_listing'in "<base_url>?download=<kodlanmış key>" biçimidir;
+    checksum dosyası aynı key dizininden aynı biçimde istenir.
+    """
+    base_url, _, encoded_key = file_url.partition("?download=")
+    key = urllib.parse.unquote(encoded_key)
+    m = KEY_DATE_RE.search(key)
+    if not m:
+        return None
+    directory, filename = os.path.dirname(key), os.path.basename(key)
+    checksum_key = f"{directory}/discogs_{m.group(1)}_CHECKSUM.txt"
+    checksum_url = base_url + "?download=" + urllib.parse.quote(checksum_key, safe="")
+    try:
+        r = (session or requests).get(checksum_url, timeout=30)
+        r.raise_for_status()
+    except requests.exceptions.RequestException:
+        return None
+    for line in r.text.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].lstrip("*") == filename:
+            return parts[0].lower()
+    return None
+
+# url -> (etag, body, checked_at) of listing pages fetched in this session
+LISTING_CACHE = {}
+# A cached listing younger than this (seconds) is used without contacting the
+# server at all; Discogs publishes new dumps once a month
+LISTING_MAX_AGE = 30 * 60
+# One keep-alive session for listing pages, so consecutive and concurrent
+# listings reuse TLS connections to data.discogs.com. requests already asks for
+# gzip; transient 5xx/connection errors are retried with backoff on the same pool.
+LISTING_SESSION = requests.Session()
+LISTING_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=("GET", "HEAD")),
+))
+# Seconds to wait for a listing page (connect and each read)
+LISTING_TIMEOUT = 30
+
+
+def fetch_listing(url, cache_dir=None):
+    """
+    GET a listing page with If-None-Match. On 304 the cached body is reused.
+    Bodies that come with an ETag are memoized in LISTING_CACHE and, if cache_dir
+    is given, in cache_dir/listing_cache/ so they survive restarts. Within
+    LISTING_MAX_AGE of the last successful check no request is made.
+    """
+    cache_file = None
+    if cache_dir:
+        cache_file = Path(cache_dir) / "listing_cache" / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    cached = LISTING_CACHE.get(url)
+    if cached is None and cache_file:
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+                # The file's mtime records the last time the server confirmed it
+                checked_at = os.fstat(f.fileno()).st_mtime
+            cached = (data["etag"], data["body"], checked_at)
+        except (OSError, ValueError, KeyError):
+            cached = None
+
+    now = time.time()
+    if cached and now - cached[2] < LISTING_MAX_AGE:
+        LISTING_CACHE[url] = cached
+        return cached[1]
+
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    r = LISTING_SESSION.get(url, headers=headers, timeout=LISTING_TIMEOUT)
+    if r.status_code == 304 and cached:
+        LISTING_CACHE[url] = (cached[0], cached[1], now)
+        if cache_file:
+            try:
+                os.utime(cache_file, (now, now))
+            except OSError:
+                pass
+        return cached[1]
+    r.raise_for_status()
+
+    # r.text decodes (and may charset-sniff) the body on every access; do it once
+    body = r.text
+    etag = r.headers.get("ETag")
+    if etag:
+        LISTING_CACHE[url] = (etag, body, now)
+        if cache_file:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump({"etag": etag, "body": body}, f)
+            except OSError as e:
+                print(f"Error writing listing cache: {e}")
+    return body
+
+
+PREFIX_LINK_RE = re.compile(r'href="\?prefix=([^"]+)"')
+
+
+def list_directories_from_s3(base_url="https://data.discogs.com/", prefix="data/", cache_dir=None):
     """Retrieve a list of 'directories' (common prefixes) from the HTML listing."""
     url = base_url + "?prefix=" + prefix
-    r = requests.get(url)
-    r.raise_for_status()
+    text = fetch_listing(url, cache_dir)
 
     # Find links like ?prefix=data%2F2025%2F
-    dirs = []
-    matches = re.findall(r'href="\?prefix=([^"]+)"', r.text)
-    for m in matches:
-        decoded_prefix = urllib.parse.unquote(m)
+    dirs = set()
+    for m in PREFIX_LINK_RE.finditer(text):
+        decoded_prefix = urllib.parse.unquote(m.group(1))
         if decoded_prefix.startswith(prefix) and decoded_prefix != prefix:
-            if decoded_prefix not in dirs:
-                dirs.append(decoded_prefix)
+            dirs.add(decoded_prefix)
     return sorted(dirs)
 
 
-def list_files_in_directory(base_url, directory_prefix):
-    """List all files (key, size, last_modified) in a particular directory prefix."""
-    url = base_url + "?prefix=" + directory_prefix
-    r = requests.get(url)
-    r.raise_for_status()
-
-    # Pattern example: 2026-01-15 16:42:07             418.0 MB       <a href="?download=data%2F2025%2Fdiscogs_20250101_artists.xml.gz">discogs_20250101_artists.xml.gz</a>
-    pattern = r'(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2})\s+([\d\.]+\s+[KMG]?B)\s+<a href="\?download=([^"]+)">([^<]+)</a>'
-    matches = re.findall(pattern, r.text)
-
-    data = []
-    for m in matches:
-        last_modified = m[0]
-        size_hr = m[1]
-        key = urllib.parse.unquote(m[2])
-        filename = m[3]
-
-        ctype = "unknown"
-        lname = filename.lower()
-        if "checksum" in lname:
-            ctype = "checksum"
-        elif "artist" in lname:
-            ctype = "artists"
-        elif "master" in lname:
-            ctype = "masters"
-        elif "label" in lname:
-            ctype = "labels"
-        elif "release" in lname:
-            ctype = "releases"
-
-        data.append({
-            "last_modified": last_modified,
-            "size": size_hr,
-            "key": key,
-            "content": ctype,
-            "URL": base_url + "?download=" + m[2] # Use the encoded key from the link
-        })
-
-    return pd.DataFrame(data)
+# Pattern example: 2026-01-15 16:42:07             418.0 MB       <a href="?download=data%2F2025%2Fdiscogs_20250101_artists.xml.gz">discogs_20250101_artists.xml.gz</a>
+LISTING_ROW_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2})\s+([\d\.]+\s+[KMG]?B)\s+<a href="\?download=([^"]+)">([^<]+)</a>'
+)
+
+# Last "_" part of a dump file name (discogs_YYYYMMDD_<part>.xml.gz) -> content type
+CONTENT_BY_NAME_PART = {
+    "artists": "artists",
+    "labels": "labels",
+    "masters": "masters",
+    "releases": "releases",
+    "checksum": "checksum",
+}
+# Fallback for names outside that pattern: file name fragment -> content type
+CONTENT_TYPE_RE = re.compile(r"(checksum|artist|master|label|release)")
+CONTENT_TYPES = {
+    "checksum": "checksum",
+    "artist": "artists",
+    "master": "masters",
+    "label": "labels",
+    "release": "releases",
+}
+
+
+def list_files_in_directory(base_url, directory_prefix, cache_dir=None):
+    """List all dump files (key, size, last_modified) in a particular directory prefix; CHECKSUM files are skipped."""
+    return parse_listing(base_url, fetch_listing(base_url + "?prefix=" + directory_prefix, cache_dir))
+
+
+def parse_listing(base_url, text):
+    """Rows of one listing page body as a raw (unsorted) listing frame."""
+    rows = []
+    for row in LISTING_ROW_RE.finditer(text):
+        last_modified, size_hr, encoded_key, filename = row.groups()
+        # Dict lookup on the part after the last "_"; the regex only for odd names
+        ctype = CONTENT_BY_NAME_PART.get(filename.rpartition("_")[2].partition(".")[0].lower())
+        if ctype is None:
+            m = CONTENT_TYPE_RE.search(filename.lower())
+            ctype = CONTENT_TYPES[m.group(1)] if m else "unknown"
+        if ctype == "checksum":
+            # Never shown in the table; drop it here instead of filtering the frame later
+            continue
+        rows.append((
+            last_modified,
+            size_hr,
+            urllib.parse.unquote(encoded_key),
+            ctype,
+            base_url + "?download=" + encoded_key  # Use the encoded key from the link
+        ))
+
+    data_df = pd.DataFrame(rows, columns=["last_modified", "size", "key", "content", "URL"])
+    return data_df.astype({"size": LISTING_STR_DTYPE, "key": LISTING_STR_DTYPE, "URL": LISTING_STR_DTYPE})
+
+
+# Display order of the dump types inside a month
+CONTENT_ORDER = ["artists", "labels", "masters", "releases", "unknown"]
+
+
+def prepare_listing_df(data_df):
+    """
+    Turn a raw list_files_in_directory() frame into the table layout:
+    parsed dates, a 'month' column, newest month first and content in
+    CONTENT_ORDER within a month. Checksum rows never get this far.
+    """
+    data_df["last_modified"] = pd.to_datetime(data_df["last_modified"], format="%Y-%m-%d %H:%M:%S")
+    # Same result as get_month_from_key per row, but one vectorized extract + parse
+    key_dates = pd.to_datetime(data_df["key"].str.extract(KEY_DATE_RE, expand=False),
+                               format="%Y%m%d", errors="coerce")
+    data_df["month"] = key_dates.dt.strftime("%Y-%m").fillna("").astype(LISTING_STR_DTYPE)
+    # Ordered categorical sorts by category code; no helper column to map and drop
+    data_df["content"] = pd.Categorical(data_df["content"], categories=CONTENT_ORDER, ordered=True)
+
+    # Sort on two small integer keys and gather the rows once: month codes follow
+    # the sorted "YYYY-MM" strings (negated for newest first), unknown content last
+    month_codes = pd.Categorical(data_df["month"]).codes.astype(np.int64)
+    content_codes = data_df["content"].cat.codes.to_numpy(dtype=np.int64)
+    content_codes[content_codes < 0] = len(CONTENT_ORDER)
+    return data_df.take(np.lexsort((content_codes, -month_codes)))
+
+
+# User guide shown by open_info: (text, Text-widget tag) pairs
+INFO_TEXT = (
+    ("Discogs Data Processor User Guide\n", "heading"),
+    ("\nIntroduction\n", "subheading"),
+    (
+    "This application helps you automatically download, extract, and convert Discogs datasets to CSV format. It includes advanced features such as multi-threaded downloads, auto-mode processing, and cover art creation.\n",
+    "normal"),
+    ("\nGetting Started\n", "subheading"),
+    ("1. Download Folder Selection:\n", "normal"),
+    ("   - Click the Settings button to select your download folder.\n", "bullet"),
+    ("   - An automatic Discogs folder is created in the selected location.\n", "bullet"),
+    ("   - By default, the ~/Downloads/Discogs folder is used.\n", "bullet"),
+    ("\n2. Fetch Data:\n", "subheading"),
+    ("   - The application automatically fetches the latest data when opened.\n", "bullet"),
+    ("   - You can also manually fetch data by clicking the Fetch Data button.\n", "bullet"),
+    ("\nButton Functions\n", "subheading"),
+    ("- Fetch Data: Fetches the latest datasets from Discogs S3.\n", "bullet"),
+    ("- Download: Downloads the selected datasets using multi-threading for faster performance.\n", "bullet"),
+    ("- Extract: Extracts the downloaded .gz files to .xml format.\n", "bullet"),
+    ("- Convert: Converts extracted .xml files to CSV format.\n", "bullet"),
+    ("- Delete: Deletes selected datasets and associated files.\n", "bullet"),
+    ("- Settings: Opens the folder selection dialog.\n", "bullet"),
+    ("- Info: Displays this user guide.\n", "bullet"),
+    ("- Create Cover Art: Allows you to select an image, specify a year/month, and generate cover art.\n",
+     "bullet"),
+    ("\nAdvanced Features\n", "subheading"),
+    ("- Multi-threaded Downloads:\n", "bullet"),
+    ("   Files are downloaded faster using multiple threads.\n", "bullet"),
+    ("- Resume Support:\n", "bullet"),
+    ("   Downloads automatically resume after connection interruptions.\n", "bullet"),
+    ("- Auto Mode:\n", "bullet"),
+    ("   Automatically chains Download → Extract → Convert processes for selected datasets.\n", "bullet"),
+    ("- Cover Art Creation:\n", "bullet"),
+    (
+    "   Adds customizable year and month text to selected images for easy dataset identification.\n", "bullet"),
+    ("\nUsage Steps\n", "subheading"),
+    ("1. Setting the Download Folder:\n", "normal"),
+    ("   - Click the Settings button.\n", "bullet"),
+    ("   - Select a folder to create the Discogs subfolder.\n", "bullet"),
+    ("\n2. Downloading Data:\n", "subheading"),
+    ("   - Fetch data automatically or via the Fetch Data button.\n", "bullet"),
+    ("   - Select datasets in the table and click Download.\n", "bullet"),
+    ("\n3. Extracting Data:\n", "subheading"),
+    ("   - Select downloaded .gz files and click Extract.\n", "bullet"),
+    ("\n4. Converting Data:\n", "subheading"),
+    ("   - Select extracted .xml files and click Convert.\n", "bullet"),
+    ("\n5. Deleting Files:\n", "subheading"),
+    ("   - Select files and click Delete to remove them permanently.\n", "bullet"),
+    ("\n6. Creating Cover Art:\n", "subheading"),
+    ("   - Click Create Cover Art.\n", "bullet"),
+    ("   - Choose an image, year, month, and optional font.\n", "bullet"),
+    ("   - Click Apply to generate and save the cover art image.\n", "bullet"),
+    ("\nStatus Tracking\n", "subheading"),
+    (
+    "- Progress bar, download speed, elapsed time, and remaining time indicators keep you informed during operations.\n",
+    "bullet"),
+    ("- File statuses (Downloaded, Extracted, Processed) are clearly displayed in the dataset table.\n",
+     "bullet"),
+    ("\nSupport\n", "subheading"),
+    (
+    "- For troubleshooting, view logs in the console area or check the discogs_data.log file in your download folder.\n",
+    "bullet"),
+    ("- For further assistance, contact the developer via provided links.\n", "bullet"),
+    ("\nThank You!\n", "subheading"),
+    ("- ofurkancoban\n", "bullet"),
+)
 
 
 class CollapsingFrame(ttk.Frame):
@@ -463,10 +1069,16 @@ class DiscogsDataProcessorUI(ttk.Frame):
         super().__init__(master, **kwargs)
         self.pack(fill=BOTH, expand=YES)
         self.data_df = data_df
-        self.stop_flag = False
+        # Set by stop_download; every worker loop checks it
+        self.stop_event = threading.Event()
+        # Held while a .part.json is written; stop_download takes it before deleting partial files
+        self.download_state_lock = Lock()
         # [UPDATED] New variable: Download folder (default: ~/Downloads/Discogs)
         default_download_dir = Path.home() / "Downloads" / "Discogs"
         self.download_dir_var = StringVar(value=str(default_download_dir))  # Use StringVar
+        # Path objects for the folder, rebuilt only when download_dir_var changes
+        self.download_root_cache = None
+        self.download_dir_var.trace_add("write", lambda *_: setattr(self, "download_root_cache", None))
 
         # Add status indicator variables
         self.status_indicator_visible = True
@@ -480,10 +1092,24 @@ class DiscogsDataProcessorUI(ttk.Frame):
         self.prog_time_elapsed_var = StringVar(value='Elapsed: 0 sec')
         self.prog_time_left_var = StringVar(value='Left: 0 sec')
         self.scroll_message_var = StringVar(value='Log: Ready.')
+        self.pending_scroll_message = None
 
         # For checkboxes in table
         self.check_vars = {}
+        # Item ids whose checkbox is ticked, kept in sync by toggle_checked
+        self.checked_items = set()
         self.checkbuttons = {}
+        self.checkbutton_layout_pending = False
+        # Last download progress written to the bar, in tenths of a percent
+        self.last_pb_tenths = None
+        # Tree item id -> data_df index label (filled in populate_table)
+        self.item_to_row = {}
+        # URL / file name / (month, content) -> data_df index label,
+        # rebuilt only when data_df's index changes
+        self.url_to_row = {}
+        self.name_to_row = {}
+        self.month_content_to_row = {}
+        self.url_to_row_index = None
 
         #######################################################################
         # 1) Load all images in a dictionary + self.photoimages
@@ -634,6 +1260,9 @@ class DiscogsDataProcessorUI(ttk.Frame):
         lbl.grid(row=2, column=0, sticky=W, pady=2)
 
         self.downloaded_size_var = StringVar(value="Calculating...")
+        self.size_update_after_id = None
+        self.size_scan_running = False
+        self.size_rescan_pending = False
         lbl = ttk.Label(ds_frm, textvariable=self.downloaded_size_var, padding=(10, 0))
         lbl.grid(row=3, column=0, sticky=W, padx=0, pady=2)
 
@@ -644,6 +1273,13 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
         # UI başlatılırken __init__ metodunda, örneğin sol panelin altına ekleyebilirsiniz:
         self.scrape_year_var = StringVar(value=str(datetime.now().year))
+        # True while a listing worker runs; further Fetch Data clicks reuse it
+        self.scrape_running = False
+        # (directory, page body) behind the current table, set by _scrape_data_s3
+        self.last_listing = None
+        # Bumped by every Fetch Data / year change; a listing worker's result is
+        # applied only if no newer listing was requested meanwhile
+        self.listing_generation = 0
         years = [str(year) for year in range(2008, datetime.now().year + 1)]
         year_frame = ttk.Frame(self, padding=7)
         year_frame.pack(side=TOP, fill=X)
@@ -801,6 +1437,10 @@ class DiscogsDataProcessorUI(ttk.Frame):
         # Configure Text widget to use the scrollbar
         st.configure(yscrollcommand=console_scrollbar.set)
 
+        # Alternating line colours, configured once
+        st.tag_configure("even_line", foreground="white")
+        st.tag_configure("odd_line", foreground="#63b4f4")
+
         self.console_text = st
 
         scroll_cf.add(output_container, textvariable=self.scroll_message_var)
@@ -816,6 +1456,8 @@ class DiscogsDataProcessorUI(ttk.Frame):
         self.log_to_console("Welcome to the Discogs Data Processor", "INFO")
         self.log_to_console("The application is fetching data automatically, please wait...", "INFO")
 
+        # Show the last saved listing right away; the scrape below replaces it
+        self.load_listing_snapshot()
         # Start scraping after short delay
         self.after(100, self.start_scraping)
         self.update_downloaded_size()
@@ -837,29 +1479,25 @@ class DiscogsDataProcessorUI(ttk.Frame):
         self.log_to_console(f"Selected year: {selected_year}", "INFO")
         # Örneğin, S3’te "data/2021/" dizinini kullanarak dosyaları listeleyelim:
         target_prefix = f"data/{selected_year}/"
-        self.update_files_for_year(target_prefix)
-    def update_files_for_year(self, directory_prefix):
+        # The listing is network I/O; keep it off the Tk thread like the startup scrape
+        self.listing_generation += 1
+        Thread(target=self.update_files_for_year,
+               args=(target_prefix, self.download_dir_var.get(), self.listing_generation),
+               daemon=True).start()
+    def update_files_for_year(self, directory_prefix, cache_dir=None, generation=None):
         """
-        S3'te belirtilen prefix (ör: "data/2021/") ile ilgili dosyaları listeler,
-        data_df'yi günceller ve tabloyu yeniden populate eder.
+        Worker thread: S3'te belirtilen prefix (ör: "data/2021/") ile ilgili dosyaları
+        listeler; data_df'yi güncelleyip tabloyu yeniden populate etmek apply_listing'in
+        işidir (Tk thread'inde).
         """
         base_url = "https://data.discogs.com/"
         try:
             # list_files_in_directory fonksiyonu S3'dan dosya bilgilerini getiriyor:
-            data_df = list_files_in_directory(base_url, directory_prefix)
+            data_df = list_files_in_directory(base_url, directory_prefix, cache_dir=cache_dir)
             if not data_df.empty:
-                data_df["last_modified"] = pd.to_datetime(data_df["last_modified"])
-                data_df["month"] = data_df["key"].apply(get_month_from_key)
-                data_df = data_df[data_df["content"] != "checksum"]
-                content_order = {"artists": 1, "labels": 2, "masters": 3, "releases": 4}
-                data_df["content_order"] = data_df["content"].map(content_order)
-                data_df = data_df.sort_values(by=["month", "content_order"], ascending=[False, True])
-                data_df.drop(columns=["content_order"], inplace=True)
-                data_df = self.mark_downloaded_files(data_df)
-                self.data_df = data_df
-                self.populate_table(data_df)
-                self.save_to_file()
-                self.log_to_console(f"{directory_prefix} files listed.", "INFO")
+                data_df = prepare_listing_df(data_df)
+                self.after(0, self.apply_listing, generation, data_df, None,
+                           f"{directory_prefix} files listed.")
             else:
                 self.log_to_console("File not found.", "WARNING")
         except Exception as e:
@@ -1141,7 +1779,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
                     )
 
                     # Save the resulting image in the "Cover Arts" folder inside the Discogs folder.
-                    discogs_folder = Path(self.download_dir_var.get())
+                    discogs_folder = self.download_root()
                     cover_arts_folder = discogs_folder / "Cover Arts"
                     cover_arts_folder.mkdir(parents=True, exist_ok=True)
                     original_ext = os.path.splitext(img_path)[1]  # e.g., ".jpg" or ".png"
@@ -1168,36 +1806,76 @@ class DiscogsDataProcessorUI(ttk.Frame):
     #  EKLENDİ: Artık update_progress_bar sınıf içinde bir metot
     ###########################################################################
     def update_progress_bar(self, current_bytes, total_bytes):
-        """Simple progress bar update, called during download."""
-        if total_bytes > 0:
-            percentage = (current_bytes / total_bytes) * 100
-            self.pb['value'] = percentage
-        else:
-            self.pb['value'] = 0
-        self.update_idletasks()
-
-    def update_time_info(self, downloaded_size, total_size, start_time):
-        """Update elapsed and left time for download progress."""
-        elapsed = (datetime.now() - start_time).total_seconds()
+        """Simple progress bar update, called during download (on the Tk thread; the mainloop repaints)."""
+        percentage = (current_bytes / total_bytes) * 100 if total_bytes > 0 else 0
+        # Skip the Tcl write when the bar would not move (0.1% resolution)
+        tenths = int(percentage * 10)
+        if tenths == self.last_pb_tenths:
+            return
+        self.last_pb_tenths = tenths
+        self.pb['value'] = percentage
+
+    def _apply_progress(self, downloaded_size, total_size, start_mono):
+        """One download progress snapshot → bar + speed/time labels, in a single Tk callback."""
+        self.update_progress_bar(downloaded_size, total_size)
+        self.update_time_info(downloaded_size, total_size, start_mono)
+
+    def update_time_info(self, downloaded_size, total_size, start_mono):
+        """Update elapsed and left time for download progress (start_mono is a time.monotonic() value)."""
+        elapsed = time.monotonic() - start_mono
+        if elapsed <= 0:
+            return
 
-        if elapsed > 0:
-            speed = (downloaded_size / elapsed) / (1024 * 1024)  # MB/s
-            self.after(0, self.prog_speed_var.set, f"Speed: {speed:.2f} MB/s")
-            self.after(0, self.prog_time_elapsed_var.set, f"Elapsed: {int(elapsed) // 60} min {int(elapsed) % 60} sec")
+        speed = (downloaded_size / elapsed) / (1024 * 1024)  # MB/s
+        speed_str = f"Speed: {speed:.2f} MB/s"
+        elapsed_str = f"Elapsed: {int(elapsed) // 60} min {int(elapsed) % 60} sec"
+        left_str = pct_str = None
+
+        if total_size <= 0:
+            # No Content-Length: only the byte count is known
+            left_str = "Left: unknown"
+            pct_str = f"Downloading: {human_readable_size(downloaded_size)}"
+        elif downloaded_size > 0:
+            percentage = (downloaded_size / total_size) * 100
+            left = (total_size - downloaded_size) / (downloaded_size / elapsed)
+            left_minutes = int(left // 60)
+            left_seconds = int(left % 60)
+            left_str = f"Left: {left_minutes} min {left_seconds} sec"
+            pct_str = f"Downloading: {percentage:.2f}%"
+
+        # All four labels in one Tk callback
+        if threading.current_thread() is threading.main_thread():
+            self._apply_time_info(speed_str, elapsed_str, left_str, pct_str)
+        else:
+            self.after(0, self._apply_time_info, speed_str, elapsed_str, left_str, pct_str)
 
-            if downloaded_size > 0:
-                percentage = (downloaded_size / total_size) * 100
-                left = (total_size - downloaded_size) / (downloaded_size / elapsed) if downloaded_size > 0 else 0
-                left_minutes = int(left // 60)
-                left_seconds = int(left % 60)
-                self.after(0, self.prog_time_left_var.set, f"Left: {left_minutes} min {left_seconds} sec")
-                self.after(0, self.prog_message_var.set, f"Downloading: {percentage:.2f}%")
+    def _apply_time_info(self, speed_str, elapsed_str, left_str, pct_str):
+        self.prog_speed_var.set(speed_str)
+        self.prog_time_elapsed_var.set(elapsed_str)
+        if left_str is not None:
+            self.prog_time_left_var.set(left_str)
+            self.prog_message_var.set(pct_str)
 
     def update_elapsed_timer(self):
-        if self.auto_mode_start_time:
-            elapsed = (datetime.now() - self.auto_mode_start_time).total_seconds()
+        if self.auto_mode_start_time is not None:
+            elapsed = time.monotonic() - self.auto_mode_start_time
             self.prog_time_elapsed_var.set(f"Elapsed: {int(elapsed) // 60} min {int(elapsed) % 60} sec")
             self.after(1000, self.update_elapsed_timer)
+    def _download_paths(self):
+        """(download folder, its Datasets subfolder) as Paths, cached until download_dir_var changes."""
+        cache = self.download_root_cache
+        if cache is None:
+            root = Path(self.download_dir_var.get())
+            cache = self.download_root_cache = (root, root / "Datasets")
+        return cache
+
+    def download_root(self):
+        return self._download_paths()[0]
+
+    def datasets_dir(self):
+        """<download folder>/Datasets, where the month folders live."""
+        return self._download_paths()[1]
+
     def open_settings(self):
         """Allows the user to select a download folder and creates a Discogs folder.
            Then automatically starts the Fetch Data process."""
@@ -1253,77 +1931,9 @@ class DiscogsDataProcessorUI(ttk.Frame):
         text_area.tag_configure("normal", font=("Arial", 12), spacing1=2, spacing3=2)
         text_area.tag_configure("bullet", font=("Arial", 12), lmargin1=25, lmargin2=50)
 
-        # Information text
-
-        info_text = [
-            ("Discogs Data Processor User Guide\n", "heading"),
-            ("\nIntroduction\n", "subheading"),
-            (
-            "This application helps you automatically download, extract, and convert Discogs datasets to CSV format. It includes advanced features such as multi-threaded downloads, auto-mode processing, and cover art creation.\n",
-            "normal"),
-            ("\nGetting Started\n", "subheading"),
-            ("1. Download Folder Selection:\n", "normal"),
-            ("   - Click the Settings button to select your download folder.\n", "bullet"),
-            ("   - An automatic Discogs folder is created in the selected location.\n", "bullet"),
-            ("   - By default, the ~/Downloads/Discogs folder is used.\n", "bullet"),
-            ("\n2. Fetch Data:\n", "subheading"),
-            ("   - The application automatically fetches the latest data when opened.\n", "bullet"),
-            ("   - You can also manually fetch data by clicking the Fetch Data button.\n", "bullet"),
-            ("\nButton Functions\n", "subheading"),
-            ("- Fetch Data: Fetches the latest datasets from Discogs S3.\n", "bullet"),
-            ("- Download: Downloads the selected datasets using multi-threading for faster performance.\n", "bullet"),
-            ("- Extract: Extracts the downloaded .gz files to .xml format.\n", "bullet"),
-            ("- Convert: Converts extracted .xml files to CSV format.\n", "bullet"),
-            ("- Delete: Deletes selected datasets and associated files.\n", "bullet"),
-            ("- Settings: Opens the folder selection dialog.\n", "bullet"),
-            ("- Info: Displays this user guide.\n", "bullet"),
-            ("- Create Cover Art: Allows you to select an image, specify a year/month, and generate cover art.\n",
-             "bullet"),
-            ("\nAdvanced Features\n", "subheading"),
-            ("- Multi-threaded Downloads:\n", "bullet"),
-            ("   Files are downloaded faster using multiple threads.\n", "bullet"),
-            ("- Resume Support:\n", "bullet"),
-            ("   Downloads automatically resume after connection interruptions.\n", "bullet"),
-            ("- Auto Mode:\n", "bullet"),
-            ("   Automatically chains Download → Extract → Convert processes for selected datasets.\n", "bullet"),
-            ("- Cover Art Creation:\n", "bullet"),
-            (
-            "   Adds customizable year and month text to selected images for easy dataset identification.\n", "bullet"),
-            ("\nUsage Steps\n", "subheading"),
-            ("1. Setting the Download Folder:\n", "normal"),
-            ("   - Click the Settings button.\n", "bullet"),
-            ("   - Select a folder to create the Discogs subfolder.\n", "bullet"),
-            ("\n2. Downloading Data:\n", "subheading"),
-            ("   - Fetch data automatically or via the Fetch Data button.\n", "bullet"),
-            ("   - Select datasets in the table and click Download.\n", "bullet"),
-            ("\n3. Extracting Data:\n", "subheading"),
-            ("   - Select downloaded .gz files and click Extract.\n", "bullet"),
-            ("\n4. Converting Data:\n", "subheading"),
-            ("   - Select extracted .xml files and click Convert.\n", "bullet"),
-            ("\n5. Deleting Files:\n", "subheading"),
-            ("   - Select files and click Delete to remove them permanently.\n", "bullet"),
-            ("\n6. Creating Cover Art:\n", "subheading"),
-            ("   - Click Create Cover Art.\n", "bullet"),
-            ("   - Choose an image, year, month, and optional font.\n", "bullet"),
-            ("   - Click Apply to generate and save the cover art image.\n", "bullet"),
-            ("\nStatus Tracking\n", "subheading"),
-            (
-            "- Progress bar, download speed, elapsed time, and remaining time indicators keep you informed during operations.\n",
-            "bullet"),
-            ("- File statuses (Downloaded, Extracted, Processed) are clearly displayed in the dataset table.\n",
-             "bullet"),
-            ("\nSupport\n", "subheading"),
-            (
-            "- For troubleshooting, view logs in the console area or check the discogs_data.log file in your download folder.\n",
-            "bullet"),
-            ("- For further assistance, contact the developer via provided links.\n", "bullet"),
-            ("\nThank You!\n", "subheading"),
-            ("- ofurkancoban\n", "bullet")
-        ]
-
-        # Insert text with tags
-        for text, tag in info_text:
-            text_area.insert('end', text, tag)
+        # Insert text with tags: Text.insert takes text/tag pairs, so the whole
+        # guide goes in with one Tcl call
+        text_area.insert('end', *(part for pair in INFO_TEXT for part in pair))
 
         text_area.config(state='disabled')  # Make text read-only
 
@@ -1336,49 +1946,109 @@ class DiscogsDataProcessorUI(ttk.Frame):
         webbrowser.open_new_tab(url)
 
     # _scrape_data_s3 fonksiyonundaki ilgili kısım:
-    def _scrape_data_s3(self):
+    def _scrape_data_s3(self, selected_year, cache_dir, generation=None):
+        """
+        Worker thread: list the selected year's dumps. Tk variables are read by
+        start_scraping; the new table is installed by apply_listing on the Tk thread.
+        """
         try:
             base_url = "https://data.discogs.com/"
             prefix = "data/"
             self.log_to_console("Listing directories from data.discogs.com...", "INFO")
-            dirs = list_directories_from_s3(base_url, prefix)
-            if not dirs:
-                self.log_to_console("No directories found.", "WARNING")
-                return
 
-            # Kullanıcının seçtiği yılı al
-            selected_year = self.scrape_year_var.get()  # Örneğin "2025"
-            # Seçilen yıla uyan dizinleri filtrele (dizin isimlerinde yıl bilgisi varsa)
-            filtered_dirs = [d for d in dirs if selected_year in d]
-            if filtered_dirs:
-                filtered_dirs.sort()
-                target_dir = filtered_dirs[-1]
-            else:
-                dirs.sort()
-                target_dir = dirs[-1]
+            # The selected year's folder is almost always the one picked below, so its
+            # listing is requested together with the directory listing (one round-trip
+            # of latency instead of two); a wrong guess is simply not used.
+            guessed_dir = f"{prefix}{selected_year}/"
+            pool = ThreadPoolExecutor(max_workers=2)
+            try:
+                guessed_listing = pool.submit(fetch_listing, base_url + "?prefix=" + guessed_dir, cache_dir)
+                dirs = list_directories_from_s3(base_url, prefix, cache_dir=cache_dir)
+                if not dirs:
+                    self.log_to_console("No directories found.", "WARNING")
+                    return
+
+                # Seçilen yıla uyan dizinleri filtrele (dizin isimlerinde yıl bilgisi varsa)
+                filtered_dirs = [d for d in dirs if selected_year in d]
+                if filtered_dirs:
+                    filtered_dirs.sort()
+                    target_dir = filtered_dirs[-1]
+                else:
+                    dirs.sort()
+                    target_dir = dirs[-1]
 
-            self.log_to_console(f"Selected directory: {target_dir}", "INFO")
+                self.log_to_console(f"Selected directory: {target_dir}", "INFO")
+
+                if target_dir == guessed_dir:
+                    body = guessed_listing.result()
+                else:
+                    body = fetch_listing(base_url + "?prefix=" + target_dir, cache_dir)
+            finally:
+                pool.shutdown(wait=False)
+
+            # Same folder, same page as the table already shows: only the local
+            # file state can have changed, so skip parse/sort/rebuild
+            if self.last_listing == (target_dir, body) and not self.data_df.empty:
+                self.refresh_statuses()
+                self.log_to_console("Listing unchanged; file statuses refreshed.", "INFO")
+                return
 
-            data_df = list_files_in_directory(base_url, target_dir)
+            data_df = parse_listing(base_url, body)
             if not data_df.empty:
-                data_df["last_modified"] = pd.to_datetime(data_df["last_modified"])
-                data_df["month"] = data_df["key"].apply(get_month_from_key)
-                data_df = data_df[data_df["content"] != "checksum"]
-                content_order = {"artists": 1, "labels": 2, "masters": 3, "releases": 4}
-                data_df["content_order"] = data_df["content"].map(content_order)
-                data_df = data_df.sort_values(by=["month", "content_order"], ascending=[False, True])
-                data_df.drop(columns=["content_order"], inplace=True)
-                data_df = self.mark_downloaded_files(data_df)
-                self.data_df = data_df
-                self.populate_table(data_df)
-                self.save_to_file()
-                self.log_to_console("Scraping completed. Data saved automatically.", "INFO")
+                data_df = prepare_listing_df(data_df)
+                self.after(0, self.apply_listing, generation, data_df, (target_dir, body),
+                           "Scraping completed. Data saved automatically.")
             else:
                 self.log_to_console("No data found in the selected directory.", "WARNING")
         except requests.exceptions.RequestException as e:
             self.log_to_console(f"Network error: {e}", "ERROR")
         except Exception as e:
             self.log_to_console(f"Error: {e}", "ERROR")
+        finally:
+            self.scrape_running = False
+
+    def apply_listing(self, generation, data_df, listing, message):
+        """
+        Tk thread: install a listing worker's prepared frame as the table (file
+        statuses, populate, save). A result older than the latest Fetch Data /
+        year change is dropped, so a slow listing cannot overwrite a newer one.
+        """
+        if generation is not None and generation != self.listing_generation:
+            return
+        self.data_df = self.mark_downloaded_files(data_df)
+        self.last_listing = listing
+        self.populate_table(self.data_df)
+        self.save_to_file()
+        self.log_to_console(message, "INFO")
+
+    def refresh_statuses(self):
+        """
+        Worker thread: re-check the files on disk for the current table. The
+        statuses are computed on a copy; apply_statuses swaps them in on the Tk thread.
+        """
+        data_df = self.data_df
+        fresh = self.mark_downloaded_files(data_df[["month", "key"]].copy())
+        self.after(0, self.apply_statuses, data_df, fresh)
+
+    def apply_statuses(self, data_df, fresh):
+        """Tk thread: write refresh_statuses' result into data_df and redraw only rows whose status changed."""
+        if data_df is not self.data_df or not fresh.index.equals(data_df.index):
+            return  # The table was replaced meanwhile and shows its own statuses
+        status_cols = ["Downloaded", "Extracted", "Processed"]
+        changed = data_df.index[
+            (data_df.reindex(columns=status_cols).to_numpy() != fresh[status_cols].to_numpy()).any(axis=1)
+        ]
+        for col in status_cols:
+            data_df[col] = fresh[col]
+        if len(changed):
+            self.redraw_status_cells(set(changed))
+
+    def redraw_status_cells(self, row_labels):
+        """Tk thread: write the three status cells of the given data_df rows into the tree."""
+        for item, idx in self.item_to_row.items():
+            if idx in row_labels and idx in self.data_df.index:
+                for col in ("Downloaded", "Extracted", "Processed"):
+                    self.tree.set(item, col, self.data_df.at[idx, col])
 
     def populate_table(self, data_df):
         if threading.current_thread() is not threading.main_thread():
@@ -1388,46 +2058,38 @@ class DiscogsDataProcessorUI(ttk.Frame):
         for cb in self.checkbuttons.values():
             cb.destroy()
         self.check_vars.clear()
+        self.checked_items.clear()
         self.checkbuttons.clear()
+        self.item_to_row.clear()
 
-        # Clear all rows in the treeview
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        # Clear all rows in the treeview (one Tcl call)
+        self.tree.delete(*self.tree.get_children())
 
         # Ensure the required columns are present
         if "month" not in data_df.columns:
             self.log_to_console("No 'month' column found in data.", "WARNING")
             return
 
-        unique_months = data_df["month"].unique()
-        color_map = {}
-        for i, month in enumerate(unique_months):
-            color_map[month] = "month1" if i % 2 == 0 else "month2"
+        # Alternating band per month, computed once for the whole column
+        month_codes = pd.factorize(data_df["month"])[0]
+        row_tags = ["month1" if code % 2 == 0 else "month2" for code in month_codes]
 
         self.tree.tag_configure("month1", background="#343a40", foreground="#f8f9fa")
         self.tree.tag_configure("month2", background="#495057", foreground="#f8f9fa")
 
-        for i, (_, row) in enumerate(data_df.iterrows()):
-            tag = color_map.get(row["month"], "month1")
-            downloaded_status = row.get("Downloaded", "✖")
-            extracted_status = row.get("Extracted", "✖")
-            processed_status = row.get("Processed", "✖")
-
-            values = [
-                "",
-                row["month"],
-                row["content"],
-                row["size"],
-                downloaded_status,
-                extracted_status,
-                processed_status,
-            ]
+        # Plain tuples instead of a Series per row; missing status columns default to ✖
+        table_rows = data_df.reindex(
+            columns=["month", "content", "size", "Downloaded", "Extracted", "Processed"],
+            fill_value="✖"
+        ).itertuples(name=None)
+
+        # Only the tree row is created here; its IntVar and Checkbutton are made on
+        # demand for visible rows in place_visible_checkbuttons (no Tcl variable per row).
+        for (idx, month, content, size, downloaded_status, extracted_status, processed_status), tag in zip(table_rows, row_tags):
+            values = ["", month, content, size, downloaded_status, extracted_status, processed_status]
             item_id = self.tree.insert("", "end", values=values, tags=(tag,))
             if item_id:
-                var = ttk.IntVar(value=0)
-                cb = ttk.Checkbutton(self.tree, variable=var)
-                self.check_vars[item_id] = var
-                self.checkbuttons[item_id] = cb
+                self.item_to_row[item_id] = idx
 
         self.position_checkbuttons()  # Recalculate checkbutton positions
 
@@ -1438,37 +2100,129 @@ class DiscogsDataProcessorUI(ttk.Frame):
         self.log_to_console("Table updated.", "INFO")
 
     def position_checkbuttons(self):
-        self.update_idletasks()
-        if not self.checkbuttons:
+        """Schedule one checkbutton layout pass; scroll/motion bursts collapse into it."""
+        if self.checkbutton_layout_pending:
             return
+        self.checkbutton_layout_pending = True
+        self.after_idle(self.place_visible_checkbuttons)
 
-        first_visible = self.tree.winfo_rooty()
-        last_visible = first_visible + self.tree.winfo_height()
+    def place_visible_checkbuttons(self):
+        self.checkbutton_layout_pending = False
+        self.update_idletasks()
 
-        for item_id, cb in list(self.checkbuttons.items()):
+        # Walk only the rows inside the viewport: find the first visible one, then
+        # follow tree.next until bbox reports the row is off-screen.
+        visible = []
+        tree_height = self.tree.winfo_height()
+        item_id = ""
+        y = 0
+        while not item_id and y < tree_height:
+            item_id = self.tree.identify_row(y)
+            y += 4
+        while item_id:
             bbox = self.tree.bbox(item_id, column=0)
             if not bbox:
-                cb.place_forget()
-                continue
+                break
+            visible.append((item_id, bbox))
+            item_id = self.tree.next(item_id)
+
+        # Rows that scrolled out of view drop their widget; the IntVar (once created) keeps the state
+        visible_ids = {item_id for item_id, _ in visible}
+        for item_id in [i for i in self.checkbuttons if i not in visible_ids]:
+            self.checkbuttons.pop(item_id).destroy()
+
+        for item_id, (x, y, width, height) in visible:
+            var = self.check_vars.get(item_id)
+            if var is None:
+                if item_id not in self.item_to_row:
+                    continue
+                # First time this row is on screen; a row never shown cannot be ticked
+                var = self.check_vars[item_id] = ttk.IntVar(value=0)
+            cb = self.checkbuttons.get(item_id)
+            if cb is None:
+                cb = ttk.Checkbutton(self.tree, variable=var,
+                                     command=lambda i=item_id: self.toggle_checked(i))
+                self.checkbuttons[item_id] = cb
 
-            x, y, width, height = bbox
             cb_width = cb.winfo_reqwidth()
             cb_height = cb.winfo_reqheight()
 
             cb_x = x + (width - cb_width) // 2
             cb_y = y + (height - cb_height) // 2
 
-            item_top = self.tree.winfo_rooty() + y
-            item_bottom = item_top + height
+            cb.place(in_=self.tree, x=cb_x, y=cb_y + 1, width=height - 2, height=height - 2)
 
-            if first_visible <= item_bottom and item_top <= last_visible:
-                cb.place(in_=self.tree, x=cb_x, y=cb_y + 1, width=height - 2, height=height - 2)
-            else:
-                cb.place_forget()
+    def purge(self, *paths, level="INFO"):
+        """Delete leftovers of an aborted step; missing files are skipped silently."""
+        for path in paths:
+            # Silmeyi doğrudan dene; ayrı exists() stat'ı yok
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                self.log_to_console(f"Could not delete {path}: {e}", "ERROR")
+                continue
+            self.log_to_console(f"Deleted incomplete file: {path}", level)
+
+    def toggle_checked(self, item_id):
+        """Checkbutton callback: mirror the IntVar into checked_items."""
+        if self.check_vars[item_id].get() == 1:
+            self.checked_items.add(item_id)
+        else:
+            self.checked_items.discard(item_id)
+
+    def checked_item_ids(self):
+        """Ticked items in table order, without a var.get() Tcl call per row."""
+        checked = self.checked_items
+        if not checked:
+            return []
+        return [item for item in self.item_to_row if item in checked]
+
+    def row_for_item(self, item):
+        """Return the data_df row behind a tree item, or None if it is no longer there."""
+        idx = self.item_to_row.get(item)
+        if idx is None or idx not in self.data_df.index:
+            return None
+        return self.data_df.loc[idx]
+
+    def refresh_row_maps(self):
+        """Rebuild the lookup dicts if data_df was replaced or reindexed since the last call."""
+        df = self.data_df
+        if self.url_to_row_index is not df.index:
+            urls = df["URL"].tolist()
+            index = df.index.tolist()
+            self.url_to_row = dict(zip(urls, index))
+            self.name_to_row = {os.path.basename(key): idx for key, idx in zip(df["key"].tolist(), index)}
+            self.month_content_to_row = dict(zip(zip(df["month"].tolist(), df["content"].tolist()), index))
+            self.url_to_row_index = df.index
+
+    def row_for_url(self, url):
+        """Return the data_df index label for a URL (O(1) after the first lookup)."""
+        self.refresh_row_maps()
+        return self.url_to_row.get(url)
+
+    def row_for_filename(self, filename):
+        """Return the data_df index label whose key ends in filename (e.g. discogs_..._labels.xml.gz)."""
+        self.refresh_row_maps()
+        return self.name_to_row.get(filename)
+
+    def row_for_month_content(self, month, content):
+        """Return the data_df index label for a month folder / content type pair."""
+        self.refresh_row_maps()
+        return self.month_content_to_row.get((month, content))
+
+    def set_row_status(self, url, **statuses):
+        """Write Downloaded/Extracted/Processed cells for one URL without a column scan."""
+        idx = self.row_for_url(url)
+        if idx is None:
+            return
+        for col, value in statuses.items():
+            self.data_df.at[idx, col] = value
 
     def delete_selected(self):
         """Delete selected files and their related files (gz, xml, csv)."""
-        checked_items = [item for item, var in self.check_vars.items() if var.get() == 1]
+        checked_items = self.checked_item_ids()
         if not checked_items:
             self.log_to_console("No file selected for deletion!", "WARNING")
             return
@@ -1485,23 +2239,25 @@ class DiscogsDataProcessorUI(ttk.Frame):
         all_deleted_files = []
         deleted_folders = []
 
-        for item in checked_items:
-            values = self.tree.item(item, "values")
-            month_val = values[1]
-            content_val = values[2]
+        # Positional column lookups: read single cells instead of boxing each row as a Series
+        df_index = self.data_df.index
+        key_col, month_col, content_col = (
+            self.data_df.columns.get_loc(col) for col in ("key", "month", "content")
+        )
+        status_cols = [self.data_df.columns.get_loc(col) for col in ("Downloaded", "Extracted", "Processed")]
+        reset_positions = []
 
+        for item in checked_items:
             # Find the corresponding row in data_df
-            row_data = self.data_df[
-                (self.data_df["month"] == month_val) &
-                (self.data_df["content"] == content_val)
-            ]
-
-            if not row_data.empty:
-                url = row_data["URL"].values[0]
-                key = row_data["key"].values[0]
-                folder_name = row_data["month"].values[0]
+            idx = self.item_to_row.get(item)
+            pos = df_index.get_loc(idx) if idx is not None and idx in df_index else None
+
+            if pos is not None:
+                key = self.data_df.iat[pos, key_col]
+                folder_name = self.data_df.iat[pos, month_col]
+                content_val = self.data_df.iat[pos, content_col]
                 filename = os.path.basename(key)
-                base_path = Path(self.download_dir_var.get()) / "Datasets" / folder_name / filename
+                base_path = self.datasets_dir() / folder_name / filename
 
                 # Get the base name without any extensions
                 base_name = filename.split('.')[0]
@@ -1512,35 +2268,39 @@ class DiscogsDataProcessorUI(ttk.Frame):
                     base_path.with_suffix(''),  # file without extension
                     base_path.with_suffix('.xml'),  # .xml file
                     base_path.with_suffix('.xml.tmp'),  # temporary .xml file
+                    rapidgzip_index_path(base_path),  # rapidgzip block index
                     base_path.parent / f"{base_name}.csv"  # .csv file
                 ]
 
-                # Delete chunk folder if it exists
+                # Delete chunk folder if it exists (no exists() pre-check: a missing
+                # folder or file just raises FileNotFoundError, which costs no extra stat)
                 chunk_folder = base_path.parent / f"chunked_{content_val}"
-                if chunk_folder.exists():
-                    try:
-                        shutil.rmtree(chunk_folder)
-                        deleted_folders.append(chunk_folder.name)
-                        self.log_to_console(f"Deleted chunk folder: {chunk_folder}", "INFO")
-                    except Exception as e:
-                        self.log_to_console(f"Error deleting chunk folder {chunk_folder}: {e}", "ERROR")
+                try:
+                    shutil.rmtree(chunk_folder)
+                    deleted_folders.append(chunk_folder.name)
+                    self.log_to_console(f"Deleted chunk folder: {chunk_folder}", "INFO")
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    self.log_to_console(f"Error deleting chunk folder {chunk_folder}: {e}", "ERROR")
 
                 # Delete all related files
-                files_deleted = []
                 for file_path in related_files:
-                    if file_path.exists():
-                        try:
-                            file_path.unlink()
-                            files_deleted.append(file_path.name)
-                            all_deleted_files.append(file_path.name)
-                            self.log_to_console(f"Deleted file: {file_path}", "INFO")
-                        except Exception as e:
-                            self.log_to_console(f"Error deleting {file_path}: {e}", "ERROR")
-
-                # Reset status in data_df
-                self.data_df.loc[self.data_df["URL"] == url, "Downloaded"] = "✖"
-                self.data_df.loc[self.data_df["URL"] == url, "Extracted"] = "✖"
-                self.data_df.loc[self.data_df["URL"] == url, "Processed"] = "✖"
+                    try:
+                        os.unlink(file_path)
+                        all_deleted_files.append(file_path.name)
+                        self.log_to_console(f"Deleted file: {file_path}", "INFO")
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        self.log_to_console(f"Error deleting {file_path}: {e}", "ERROR")
+
+                # Status is reset for all deleted rows at once after the loop
+                reset_positions.append(pos)
+
+        # Reset status in data_df (one assignment for every deleted row)
+        if reset_positions:
+            self.data_df.iloc[reset_positions, status_cols] = "✖"
 
         # Update the table display
         self.populate_table(self.data_df)
@@ -1584,80 +2344,83 @@ class DiscogsDataProcessorUI(ttk.Frame):
         # Get current line count (excluding the new line we're about to add)
         current_line = int(self.console_text.index('end-1c').split('.')[0])
 
-        # Configure tags for alternating colors
-        self.console_text.tag_configure("even_line", foreground="white")
-        self.console_text.tag_configure("odd_line", foreground="#63b4f4")
-
         # Apply tag based on line number
         tag = "even_line" if current_line % 2 == 0 else "odd_line"
 
         # Insert the message with appropriate color tag
         self.console_text.insert('end', formatted_message, tag)
 
+        # Keep the widget bounded so long sessions don't slow down redraws
+        if current_line > CONSOLE_MAX_LINES:
+            self.console_text.delete('1.0', f'{CONSOLE_TRIM_LINES + 1}.0')
+
         # Auto-scroll and update UI
         self.console_text.see('end')
         self.console_text.config(state='disabled')
 
-        # Update scroll message with truncated content
+        # Update scroll message with truncated content (coalesced, see flush_scroll_message)
         msg_short = message.strip()
         if len(msg_short) > 80:
             msg_short = msg_short[:80] + '...'
-        self.scroll_message_var.set(f"Log: {msg_short}")
+        if self.pending_scroll_message is None:
+            self.after(SCROLL_MESSAGE_INTERVAL_MS, self.flush_scroll_message)
+        self.pending_scroll_message = f"Log: {msg_short}"
 
         # Save log to file
         try:
-            log_path = Path(self.download_dir_var.get()) / "discogs_data.log"
+            log_path = self.download_root() / "discogs_data.log"
             log_path.parent.mkdir(parents=True, exist_ok=True)
             with open(log_path, 'a', encoding='utf-8') as f:
                 f.write(formatted_message)
         except Exception as e:
             print(f"Error saving log to file: {e}")
 
+    def flush_scroll_message(self):
+        """Show the latest queued log preview in the status bar."""
+        if self.pending_scroll_message is not None:
+            self.scroll_message_var.set(self.pending_scroll_message)
+            self.pending_scroll_message = None
+
     def mark_downloaded_files(self, data_df):
         """Ensure columns 'Downloaded', 'Extracted', 'Processed' exist, defaulting to ✖,
            and check on disk if each file is present."""
-        for col in ["Downloaded", "Extracted", "Processed"]:
-            if col not in data_df.columns:
-                data_df[col] = "✖"
-
-        downloads_dir = Path(self.download_dir_var.get()) / "Datasets"
-        for idx, row in data_df.iterrows():
-            folder_name = str(row["month"])
-            filename = os.path.basename(row["URL"])
-            file_path = downloads_dir / folder_name / filename
-
-            downloaded_status = "✖"
-            extracted_status = "✖"
-            processed_status = "✖"
-
-            # Check if the compressed file is present
-            if file_path.exists():
-                downloaded_status = "✔"
-
-                # If it's .gz, check for extracted .xml
-                if file_path.suffix.lower() == ".gz":
-                    extracted_file = file_path.with_suffix('')
-                    if extracted_file.exists() and extracted_file.suffix.lower() == ".xml":
-                        extracted_status = "✔"
-                        csv_file = extracted_file.with_suffix('.csv')
-                        if csv_file.exists():
-                            processed_status = "✔"
-                else:
-                    # If it's not gz but maybe raw .xml
-                    if file_path.suffix.lower() == ".xml":
-                        extracted_status = "✔"
-                        # check .csv
-                        csv_file = file_path.with_suffix('.csv')
-                        if csv_file.exists():
-                            processed_status = "✔"
-
-            data_df.at[idx, "Downloaded"] = downloaded_status
-            data_df.at[idx, "Extracted"] = extracted_status
-            data_df.at[idx, "Processed"] = processed_status
+        downloads_dir = self.datasets_dir()
+
+        folders = data_df["month"].astype(str)
+        # Files are saved under the key's last path part; the URL ends in an encoded
+        # "?download=data%2F..." query whose basename never matches a file on disk
+        filenames = data_df["key"].astype(str).str.rsplit("/", n=1).str[-1].astype(str)
+
+        # One directory listing per month folder instead of up to three stat() calls per row;
+        # every file on disk becomes a "<month>/<name>" key
+        present = set()
+        for folder_name in folders.unique():
+            try:
+                with os.scandir(downloads_dir / folder_name) as it:
+                    present.update(f"{folder_name}/{entry.name}" for entry in it)
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+
+        def on_disk(names):
+            return (folders + "/" + names).isin(present)
+
+        lower = filenames.str.lower()
+        is_gz = lower.str.endswith(".gz")
+        # .gz -> extracted .xml next to it; a raw .xml counts as extracted itself
+        xml_names = filenames.where(~is_gz, filenames.str[:-3])
+        csv_names = xml_names.str[:-4] + ".csv"
+
+        downloaded = on_disk(filenames)
+        extracted = downloaded & xml_names.str.lower().str.endswith(".xml") & (~is_gz | on_disk(xml_names))
+        processed = extracted & on_disk(csv_names)
+
+        # The boolean masks are the category codes (False -> ✖, True -> ✔)
+        for col, mask in (("Downloaded", downloaded), ("Extracted", extracted), ("Processed", processed)):
+            data_df[col] = pd.Categorical.from_codes(mask.to_numpy(dtype=np.int8), dtype=STATUS_DTYPE)
         return data_df
 
     def start_download(self, url, filename, folder_name):
-        self.stop_flag = False
+        self.stop_event.clear()
         self.log_to_console(f"Starting download of {filename}", "INFO")
         self.log_to_console(f"Destination folder: {folder_name}", "INFO")
         self.log_to_console(f"Source URL: {url}", "INFO")
@@ -1670,7 +2433,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
         Örneğin, <a href="...">2021/</a> şeklinde bulunan yıl değerlerini çıkarır.
         """
         try:
-            response = requests.get(url)
+            response = LISTING_SESSION.get(url, timeout=LISTING_TIMEOUT)
             response.raise_for_status()
             html = response.text
             # <a ...>2021/</a> gibi desenleri yakalayalım; yakalanan grup, 4 basamaklı yıl.
@@ -1680,15 +2443,19 @@ class DiscogsDataProcessorUI(ttk.Frame):
             print(f"Error scraping years: {e}")
             return []
 
-    def parallel_download(self, url, filename, folder_name, total_size):
+    def parallel_download(self, url, filename, folder_name, total_size, session):
         """
         Bağlantı kopmaları durumunda kaldığı yerden devam edebilen çok parçalı indirme.
-        .partN dosyalarında kısmi boyutu kontrol ederek kaldığı yerden devam eder.
+        Parçalar önceden boyutlandırılmış tek bir <dosya>.part dosyasına kendi
+        offset'lerine yazılır (birleştirme adımı yok); parça ilerlemesi
+        <dosya>.part.json'da tutulur, böylece sonraki denemede kaldığı yerden devam eder.
         """
-        downloads_dir = Path(self.download_dir_var.get()) / "Datasets"
+        downloads_dir = self.datasets_dir()
         target_dir = downloads_dir / folder_name
         target_dir.mkdir(parents=True, exist_ok=True)
         file_path = target_dir / filename
+        part_path = file_path.with_name(file_path.name + ".part")
+        state_path = file_path.with_name(file_path.name + ".part.json")
 
         human_size = human_readable_size(total_size)
         self.log_to_console(f"File size: {human_size}", "INFO")
@@ -1698,35 +2465,79 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
         num_threads = 8
         chunk_size = total_size // num_threads
+        segments = []
+        for i in range(num_threads):
+            start = i * chunk_size
+            # Son parçaya kadar normal, son parçada kalan her şeyi al
+            end = (start + chunk_size - 1) if i < num_threads - 1 else (total_size - 1)
+            segments.append((start, end))
+
+        # Tüm parçalar download_file'ın Session'ını paylaşır: HEAD isteğinin ve
+        # retry'ların bağlantıları (TCP/TLS) yeniden kullanılır
 
         # Her parçanın indirme durumunu izlemek için:
         thread_progress = [0] * num_threads  # (indirilmiş byte sayısı)
+        progress_q = queue.Queue()  # parçalardan gözetmene: yeni byte sayısı ya da None (bitti)
         lock = Lock()  # thread_progress güncellerken çakışma olmaması için
 
+        # Önceki denemeden kalan ilerleme (aynı boyut ve parça düzeni ise)
+        if part_path.exists() and state_path.exists():
+            try:
+                with open(state_path, encoding="utf-8") as f:
+                    state = json.load(f)
+                if state["total_size"] == total_size and len(state["done"]) == num_threads:
+                    thread_progress = [
+                        min(int(done), end - start + 1) for done, (start, end) in zip(state["done"], segments)
+                    ]
+                    self.log_to_console(f"Resuming {filename} at {human_readable_size(sum(thread_progress))}", "INFO")
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        # Dosyaya flush edilmiş kısım; .part.json'a yalnızca bu yazılır
+        saved_progress = list(thread_progress)
+
+        # Hedefi baştan boyutlandır; her parça kendi offset'ine yazar
+        with open(part_path, "r+b" if part_path.exists() else "wb") as f:
+            f.truncate(total_size)
+
+        def save_state(idx):
+            """
+            Records segment idx as written up to its current progress (call only
+            after its file was flushed or closed) and writes the per-segment
+            progress next to the .part file. Other segments keep their last
+            flushed value, so bytes still in their write buffers are never claimed.
+            Skipped once the user stopped: stop_download deletes the partial files.
+            """
+            with lock:
+                saved_progress[idx] = thread_progress[idx]
+                done = list(saved_progress)
+            with self.download_state_lock:
+                if self.stop_event.is_set():
+                    return
+                try:
+                    with open(state_path, "w", encoding="utf-8") as f:
+                        json.dump({"total_size": total_size, "done": done}, f)
+                except OSError as e:
+                    self.log_to_console(f"Could not save download state: {e}", "WARNING")
+
         # İlgili parça için Range-based download yapan fonksiyon
         def download_segment(idx, start, end):
             """
             Bir parçanın (chunk) yeniden bağlanma (resume) mantığıyla
             sınırsız tekrar deneme (retry) yaparak indirilmesini sağlar.
             """
-            part_file = file_path.with_name(file_path.name + f".part{idx}")
             expected_chunk_size = (end - start + 1)
 
-            while not self.stop_flag:
+            while not self.stop_event.is_set():
                 try:
-                    # Eğer daha önce kısmen indirildi ise, boyutuna bak:
-                    downloaded_so_far = 0
-                    if part_file.exists():
-                        downloaded_so_far = part_file.stat().st_size
-                        # Zaten ilgili chunk'tan daha büyükse => chunk tamam
-                        if downloaded_so_far >= expected_chunk_size:
-                            self.log_to_console(
-                                f"[Thread-{idx}] Chunk already fully downloaded ({part_file.name}).",
-                                "INFO"
-                            )
-                            with lock:
-                                thread_progress[idx] = expected_chunk_size
-                            return
+                    downloaded_so_far = thread_progress[idx]
+                    # Parça zaten tamamsa çık
+                    if downloaded_so_far >= expected_chunk_size:
+                        self.log_to_console(
+                            f"[Thread-{idx}] Chunk already fully downloaded.",
+                            "INFO"
+                        )
+                        return
 
                     # Kaldığımız yerden devam edilmesi için range'i ayarla
                     chunk_start = start + downloaded_so_far
@@ -1738,21 +2549,37 @@ class DiscogsDataProcessorUI(ttk.Frame):
                         "INFO"
                     )
 
-                    r = requests.get(url, headers=headers, stream=True, timeout=30)
+                    r = session.get(url, headers=headers, stream=True, timeout=30)
                     # Normalde 206 döner; 200 veya 416 gibi durumlarda da kontrol
                     if r.status_code in (200, 206):
-                        # Append modunda açarak kaldığımız yerden yaz
-                        with open(part_file, "ab") as f:
-                            for chunk in r.iter_content(chunk_size=1024 * 64):
-                                if self.stop_flag:
-                                    return  # Kullanıcı iptali
+                        # Parçanın offset'inden itibaren .part dosyasına yaz
+                        with r, open(part_path, "r+b", buffering=DOWNLOAD_WRITE_BUFFER) as f:
+                            f.seek(chunk_start)
+                            since_checkpoint = 0
+                            for chunk in r.iter_content(chunk_size=DOWNLOAD_READ_SIZE):
+                                if self.stop_event.is_set():
+                                    break  # Kullanıcı iptali
                                 if chunk:
                                     f.write(chunk)
                                     downloaded_len = len(chunk)
                                     # thread_progress güncelle
                                     with lock:
                                         thread_progress[idx] += downloaded_len
+                                    progress_q.put_nowait(downloaded_len)
+                                    since_checkpoint += downloaded_len
+                                    if since_checkpoint >= DOWNLOAD_CHECKPOINT_BYTES:
+                                        f.flush()
+                                        save_state(idx)
+                                        since_checkpoint = 0
+                        # Dosya kapandı => tamponda kalan byte'lar da yazıldı
+                        save_state(idx)
+                        if self.stop_event.is_set():
+                            return
+                        if thread_progress[idx] < expected_chunk_size:
+                            # Bağlantı erken kapandı => kalan kısmı tekrar iste
+                            continue
                     elif r.status_code == 416:
+                        r.close()
                         # 416 => İstenen aralık dosyanın sonunu aşıyor (muhtemelen çoktan bitmiş)
                         self.log_to_console(
                             f"[Thread-{idx}] 416 Range Not Satisfiable (already complete?)",
@@ -1763,6 +2590,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
                             thread_progress[idx] = expected_chunk_size
                         return
                     else:
+                        r.close()
                         # Beklenmeyen durum => yeniden dene
                         self.log_to_console(
                             f"[Thread-{idx}] Unexpected status code {r.status_code}, retrying...",
@@ -1771,11 +2599,12 @@ class DiscogsDataProcessorUI(ttk.Frame):
                         time.sleep(5)
                         continue
 
-                    # Parça başarıyla indirildi veya döngü tamam:
+                    # Parça başarıyla indirildi:
                     return
 
                 except requests.exceptions.RequestException as e:
-                    # Bağlantı koptu, tekrar deneyeceğiz
+                    # Bağlantı koptu, tekrar deneyeceğiz (dosya with bloğunda kapandı)
+                    save_state(idx)
                     self.log_to_console(
                         f"[Thread-{idx}] Connection error: {e}. Retrying in 5s...",
                         "ERROR"
@@ -1783,87 +2612,99 @@ class DiscogsDataProcessorUI(ttk.Frame):
                     time.sleep(5)
                     # Tekrar while döngüsüne girerek kaldığı yerden devam etmeyi dener
 
+        def run_segment(idx, start, end):
+            try:
+                download_segment(idx, start, end)
+            finally:
+                progress_q.put(None)  # bu parça bitti (başarılı, iptal ya da hata)
+
         # -----------------------------------------------------------------------
         # Tüm thread'leri başlat
         threads = []
-        for i in range(num_threads):
-            start = i * chunk_size
-            # Son thread'e kadar normal, son thread'te kalan her şeyi al
-            end = (start + chunk_size - 1) if i < num_threads - 1 else (total_size - 1)
-            t = Thread(target=download_segment, args=(i, start, end), daemon=True)
+        for i, (start, end) in enumerate(segments):
+            t = Thread(target=run_segment, args=(i, start, end), daemon=True)
             threads.append(t)
             t.start()
 
         # -----------------------------------------------------------------------
         # İlerleme kontrolü
-        start_time = datetime.now()
+        start_time = datetime.now()  # yalnızca "Started at" için; süre hesapları monotonic
+        start_mono = time.monotonic()
         self.prog_time_started_var.set(f'Started at: {start_time.strftime("%Y-%m-%d %H:%M:%S")}')
 
-        while any(t.is_alive() for t in threads):
-            if self.stop_flag:
+        # Parçalar her chunk'ta byte sayısını, bitince None gönderir; sabit bir
+        # uyku yerine kuyrukta bekleriz, son parça bitince hemen çıkılır.
+        running = len(threads)
+        last_ui = 0.0
+        while running:
+            if self.stop_event.is_set():
                 # İptal => thread'ler kendileri `return` ile sonlanacak
                 break
+            try:
+                item = progress_q.get(timeout=0.25)
+            except queue.Empty:
+                continue
+            if item is None:
+                running -= 1
 
-            # İndirilen toplam byte
-            downloaded_size = sum(thread_progress)
-            self.update_progress_bar(downloaded_size, total_size)
-            self.update_time_info(downloaded_size, total_size, start_time)
-
-            time.sleep(0.5)
+            # İndirilen toplam byte; UI güncellemesi Tk thread'inde tek callback ile
+            now = time.monotonic()
+            if now - last_ui >= DOWNLOAD_UI_INTERVAL or not running:
+                last_ui = now
+                downloaded_size = sum(thread_progress)
+                self.after(0, self._apply_progress, downloaded_size, total_size, start_mono)
 
-        # Thread'leri bekle (stop_flag ile iptal edilmişse gene de join)
+        # Thread'leri bekle (stop_event ile iptal edilmişse gene de join)
         for t in threads:
             t.join()
 
-        if self.stop_flag:
+        if self.stop_event.is_set():
             self.log_to_console("Download stopped by user.", "WARNING")
             return False
 
-        # Tüm parçalar (chunk) başarıyla indi => .part dosyalarını birleştir
-        with open(file_path, "wb") as f_out:
-            for i in range(num_threads):
-                part_file = file_path.with_name(file_path.name + f".part{i}")
-                if part_file.exists():
-                    with open(part_file, "rb") as f_in:
-                        shutil.copyfileobj(f_in, f_out)
-                    part_file.unlink()  # Parçayı sil
+        if sum(thread_progress) < total_size:
+            self.log_to_console(f"{filename}: not all segments completed.", "ERROR")
+            return False
+
+        # Tüm parçalar yerinde => .part dosyasını hedef ada taşı (birleştirme yok)
+        os.replace(part_path, file_path)
+        state_path.unlink(missing_ok=True)
 
         self.log_to_console(f"{filename} successfully downloaded => {file_path}", "INFO")
         return True
 
     def download_file(self, url, filename, folder_name):
+        self.last_pb_tenths = None  # the bar may have been moved by another operation
         self.show_speed_and_left()
         self.start_status_indicator()
         file_path = None
+        # HEAD, range parçaları ve tek-thread yedeği aynı bağlantı havuzunu kullanır
+        session = new_download_session()
         try:
             self.prog_message_var.set('Preparing download...')
-            head = requests.head(url)
+            head = session.head(url)
             head.raise_for_status()
             total_size = int(head.headers.get('Content-Length', 0))
             accept_ranges = head.headers.get('Accept-Ranges', 'none')
 
             if total_size > 0 and accept_ranges.lower() == 'bytes':
-                success = self.parallel_download(url, filename, folder_name, total_size)
+                success = self.parallel_download(url, filename, folder_name, total_size, session)
                 if not success:
-                    if self.stop_flag:
+                    if self.stop_event.is_set():
                         self.log_to_console("Operation Stopped", "WARNING")
-                        file_path = Path(self.download_dir_var.get()) / "Datasets" / folder_name / filename
-                        if file_path.exists():
-                            file_path.unlink()
-                            self.log_to_console(f"Incomplete file {file_path} deleted.", "WARNING")
+                        file_path = self.datasets_dir() / folder_name / filename
+                        self.purge(file_path, level="WARNING")
                         self.prog_message_var.set('Idle...')
                         return
                     else:
                         self.log_to_console("Parallel download failed, falling back to single-thread.", "WARNING")
-                        self.single_thread_download(url, filename, folder_name)
+                        self.single_thread_download(url, filename, folder_name, session)
                 else:
-                    downloads_dir = Path(self.download_dir_var.get()) / "Datasets"
+                    downloads_dir = self.datasets_dir()
                     file_path = downloads_dir / folder_name / filename
                     self.log_to_console(f"{filename} successfully downloaded: {file_path}", "INFO")
                     self.hide_speed_and_left()
-                    self.data_df.loc[self.data_df["URL"] == url, "Downloaded"] = "✔"
-                    self.data_df.loc[self.data_df["URL"] == url, "Extracted"] = "✖"
-                    self.data_df.loc[self.data_df["URL"] == url, "Processed"] = "✖"
+                    self.set_row_status(url, Downloaded="✔", Extracted="✖", Processed="✖")
                     # Update UI and downloaded size
                     self.populate_table(self.data_df)
                     self.update_downloaded_size()
@@ -1876,18 +2717,19 @@ class DiscogsDataProcessorUI(ttk.Frame):
                             "info"
                         ))
             else:
-                self.single_thread_download(url, filename, folder_name)
+                self.single_thread_download(url, filename, folder_name, session)
 
         except Exception as e:
             self.log_to_console(f"Error: {e}", "ERROR")
-            if file_path and file_path.exists():
-                file_path.unlink()
-                self.log_to_console(f"Incomplete file {file_path} deleted.", "WARNING")
+            if file_path:
+                self.purge(file_path, level="WARNING")
             self.after(0, lambda: self.show_centered_popup(
                 "Download Error",
                 f"Error during download:\n{str(e)}",
                 "error"
             ))
+        finally:
+            session.close()
 
         self.stop_status_indicator()
 
@@ -1905,16 +2747,15 @@ class DiscogsDataProcessorUI(ttk.Frame):
                 # Doğru satırı bulmak için URL'yi kullanacağız (dosya adına göre):
                 filename = downloaded_file_path.name + ".gz" if not downloaded_file_path.name.endswith(
                     '.gz') else downloaded_file_path.name
-                self.data_df.loc[
-                    self.data_df["URL"].str.endswith(filename),
-                    "Extracted"
-                ] = "✔"
+                idx = self.row_for_filename(filename)
+                if idx is not None:
+                    self.data_df.at[idx, "Extracted"] = "✔"
 
                 # Tablodaki değişikliği göster:
                 self.populate_table(self.data_df)
 
                 # Extract işleminden sonra otomatik convert başlatılır:
-                self.after(1000, lambda: self.convert_selected([downloaded_file_path.with_suffix('')]))
+                self.after_idle(self.convert_selected, [downloaded_file_path.with_suffix('')])
             else:
                 self.log_to_console(f"Extraction failed or stopped: {downloaded_file_path}", "ERROR")
                 self.populate_table(self.data_df)
@@ -1935,72 +2776,86 @@ class DiscogsDataProcessorUI(ttk.Frame):
         except queue.Empty:
             self.after(100, self.handle_download_status, q)
 
-    def single_thread_download(self, url, filename, folder_name):
+    def single_thread_download(self, url, filename, folder_name, session=None):
         """Single-threaded download implementation."""
         self.log_to_console("Switching to single-threaded download", "INFO")
         
-        # Get key for status updates
-        row_data = self.data_df[self.data_df["URL"] == url]
-        if row_data.empty:
+        # Status updates go through the URL's row
+        if self.row_for_url(url) is None:
             self.log_to_console(f"Could not find row for URL: {url}", "ERROR")
             return
-        key = row_data["key"].values[0]
         self.log_to_console("Reason: Server doesn't support partial downloads", "INFO")
 
-        downloads_dir = Path(self.download_dir_var.get()) / "Datasets"
+        downloads_dir = self.datasets_dir()
         target_dir = downloads_dir / folder_name
         target_dir.mkdir(parents=True, exist_ok=True)
         file_path = target_dir / filename
 
         try:
-            response = requests.get(url, stream=True)
+            response = (session or requests).get(url, stream=True)
             total_size = int(response.headers.get('content-length', 0))
             human_size = human_readable_size(total_size)
 
             self.log_to_console(f"File size: {human_size}", "INFO")
             self.log_to_console(f"Target path: {file_path}", "INFO")
 
-            block_size = 1024 * 64
-            self.pb["value"] = 0
-            self.pb["maximum"] = total_size
-            self.pb.update()
+            block_size = DOWNLOAD_READ_SIZE
+            self.after(0, self.pb.configure, {"value": 0})
 
             self.prog_current_file_var.set(f"File: {filename}")
 
-            start_time = datetime.now()
+            start_time = datetime.now()  # yalnızca "Started at" için; süre hesapları monotonic
+            start_mono = time.monotonic()
             self.prog_time_started_var.set(f'Started at: {start_time.strftime("%Y-%m-%d %H:%M:%S")}')
             downloaded_size = 0
+            # UI'ya her blokta değil, 200 ms geçince veya 8 MiB daha inince güncelleme gönder
+            last_ui_bytes = 0
+            last_ui_time = time.monotonic()
+            # Hash while writing, so verifying against CHECKSUM.txt needs no second read of the file
+            sha256 = hashlib.sha256()
 
-            with open(file_path, "wb") as file:
+            with open(file_path, "wb", buffering=DOWNLOAD_WRITE_BUFFER) as file:
                 for data in response.iter_content(block_size):
-                    if self.stop_flag:
+                    if self.stop_event.is_set():
                         file.close()
                         file_path.unlink(missing_ok=True)
                         return
                     file.write(data)
+                    sha256.update(data)
                     downloaded_size += len(data)
-                    
-                    # Thread-safe UI update
-                    self.after(0, lambda d=downloaded_size: self.pb.configure(value=d))
-
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    if elapsed > 0:
-                        speed = (downloaded_size / elapsed) / (1024 * 1024)
-                        self.after(0, self.prog_speed_var.set, f'Speed: {speed:.2f} MB/s')
-
-                        if total_size > 0:
-                            percentage = (downloaded_size / total_size) * 100
-                            left = int((total_size - downloaded_size) / (downloaded_size / elapsed))
-                            left_minutes = left // 60
-                            left_seconds = left % 60
-                            self.after(0, self.prog_time_left_var.set, f'Left: {left_minutes} min {left_seconds} sec')
-                            self.after(0, self.prog_message_var.set, f'Downloading: {percentage:.2f}%')
+
+                    now = time.monotonic()
+                    if downloaded_size - last_ui_bytes >= DOWNLOAD_UI_MIN_BYTES or now - last_ui_time >= DOWNLOAD_UI_INTERVAL:
+                        last_ui_bytes = downloaded_size
+                        last_ui_time = now
+                        # Thread-safe UI update
+                        self.after(0, self._apply_progress, downloaded_size, total_size, start_mono)
+
+            self.after(0, self._apply_progress, downloaded_size, total_size, start_mono)
+
+            expected_sha256 = fetch_expected_sha256(url, session)
+            if expected_sha256 is None:
+                self.log_to_console(f"No published checksum found for {filename}; skipping verification.", "INFO")
+            elif sha256.hexdigest() == expected_sha256:
+                self.log_to_console(f"SHA256 verified for {filename}", "INFO")
+            else:
+                # Bozuk indirme başarısız sayılır: dosya silinir, satır ✖ kalır
+                self.log_to_console(f"SHA256 mismatch for {filename}: the download is corrupt.", "ERROR")
+                self.purge(file_path, level="ERROR")
+                self.set_row_status(url, Downloaded="✖", Extracted="✖", Processed="✖")
+                self.after(0, lambda: self.populate_table(self.data_df))
+                self.after(0, self.update_downloaded_size)
+                self.prog_message_var.set('Idle...')
+                self.show_centered_popup(
+                    "Download Error",
+                    f"{filename} failed SHA256 verification and was deleted.",
+                    "error"
+                )
+                return
 
             self.prog_message_var.set('Idle...')
             self.log_to_console(f"{filename} successfully downloaded: {file_path}", "INFO")
-            self.data_df.loc[self.data_df["key"] == key, "Downloaded"] = "✔"
-            self.data_df.loc[self.data_df["key"] == key, "Extracted"] = "✖"
-            self.data_df.loc[self.data_df["key"] == key, "Processed"] = "✖"
+            self.set_row_status(url, Downloaded="✔", Extracted="✖", Processed="✖")
             self.after(0, lambda: self.populate_table(self.data_df))
             self.after(0, self.update_downloaded_size)
 
@@ -2019,7 +2874,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
         (download, extract, convert, chunking) and cleans up any partial files.
         Finally updates the table to reflect the current status.
         """
-        self.stop_flag = True
+        self.stop_event.set()
         self.log_to_console("Operation Stopped. Cleaning up...", "WARNING")
         self.prog_message_var.set('Stopping...')
 
@@ -2034,28 +2889,31 @@ class DiscogsDataProcessorUI(ttk.Frame):
         # Yanıp sönen durum göstergesini kapat
         self.stop_status_indicator()
 
-        # Cleanup: Yarım kalan indirme veya chunk klasörlerini vb. temizle
-        downloads_dir = Path(self.download_dir_var.get()) / "Datasets"
-        if downloads_dir.exists():
-            for folder in downloads_dir.glob("*"):
-                if folder.is_dir():
-                    # Chunk klasörlerini sil
-                    chunk_folders = list(folder.glob("chunked_*"))
-                    for chunk_folder in chunk_folders:
-                        try:
-                            shutil.rmtree(chunk_folder)
-                            self.log_to_console(f"Cleaned up chunk folder: {chunk_folder}", "INFO")
-                        except Exception as e:
-                            self.log_to_console(f"Error cleaning up {chunk_folder}: {e}", "ERROR")
-
-                    # .part*, .tmp gibi yarım kalan dosyaları sil
-                    for file in folder.glob("*"):
-                        if file.name.endswith(('.part', '.tmp')) or ".part" in file.name:
+        # Cleanup: Yarım kalan indirme veya chunk klasörlerini vb. temizle.
+        # Kilit: o an .part.json yazan bir parça bitene kadar bekle; sonrakiler
+        # stop_event'i görüp yazmaz, böylece silinen durum dosyası geri gelmez
+        downloads_dir = self.datasets_dir()
+        with self.download_state_lock:
+            if downloads_dir.exists():
+                for folder in downloads_dir.glob("*"):
+                    if folder.is_dir():
+                        # Chunk klasörlerini sil
+                        chunk_folders = list(folder.glob("chunked_*"))
+                        for chunk_folder in chunk_folders:
                             try:
-                                file.unlink()
-                                self.log_to_console(f"Cleaned up partial file: {file}", "INFO")
+                                shutil.rmtree(chunk_folder)
+                                self.log_to_console(f"Cleaned up chunk folder: {chunk_folder}", "INFO")
                             except Exception as e:
-                                self.log_to_console(f"Error cleaning up {file}: {e}", "ERROR")
+                                self.log_to_console(f"Error cleaning up {chunk_folder}: {e}", "ERROR")
+
+                        # .part*, .tmp gibi yarım kalan dosyaları sil
+                        for file in folder.glob("*"):
+                            if file.name.endswith(('.part', '.tmp')) or ".part" in file.name:
+                                try:
+                                    file.unlink()
+                                    self.log_to_console(f"Cleaned up partial file: {file}", "INFO")
+                                except Exception as e:
+                                    self.log_to_console(f"Error cleaning up {file}: {e}", "ERROR")
 
         # TABLO GÜNCELLEME (dosya durumlarını tekrar kontrol et)
         self.data_df = self.mark_downloaded_files(self.data_df)
@@ -2070,7 +2928,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
         self.auto_mode_start_time = None
     def download_selected(self):
-        checked_items = [item for item, var in self.check_vars.items() if var.get() == 1]
+        checked_items = self.checked_item_ids()
         if not checked_items:
             messagebox.showwarning("Warning", "No file selected!")
             return
@@ -2079,24 +2937,19 @@ class DiscogsDataProcessorUI(ttk.Frame):
         selected_data = []
         for item in checked_items:
             try:
-                v = self.tree.item(item, "values")
-                month_val, content_val, size_val = v[1], v[2], v[3]
-                row_data = self.data_df[
-                    (self.data_df["month"] == month_val) &
-                    (self.data_df["content"] == content_val)
-                ]
-                if not row_data.empty:
+                row = self.row_for_item(item)
+                if row is not None:
                     selected_data.append({
-                        "url": row_data["URL"].values[0],
-                        "key": row_data["key"].values[0],
-                        "month": row_data["month"].values[0]
+                        "url": row["URL"],
+                        "key": row["key"],
+                        "month": row["month"]
                     })
             except Exception as e:
                 self.log_to_console(f"CAPTURE ERROR: {e}", "ERROR")
 
         if self.auto_mode_var.get():
-            # Pass pre-captured data to the thread
-            Thread(target=self.auto_mode_process, args=(selected_data,), daemon=True).start()
+            # Runs on the Tk loop; each stage is polled with self.after
+            self.auto_mode_process(selected_data)
         else:
             for data in selected_data:
                 self.start_download(data["url"], os.path.basename(data["key"]), data["month"])
@@ -2108,7 +2961,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
         Auto Mode aktifken; seçili dosyalar için download, extract, chunking ve convert işlemlerini
         sırasıyla gerçekleştiren zincirleme işlemi yapar.
         """
-        self.auto_mode_start_time = datetime.now()
+        self.auto_mode_start_time = time.monotonic()
         self.update_elapsed_timer()
         
         if not selected_data:
@@ -2122,55 +2975,43 @@ class DiscogsDataProcessorUI(ttk.Frame):
             self.start_download(url, filename, folder_name)
 
         self.log_to_console("Auto Mode: Downloads initiated. Waiting...", "INFO")
-        while not self.stop_flag:
-            all_done = True
-            for data in selected_data:
-                row = self.data_df[self.data_df["key"] == data["key"]]
-                if not row.empty and row.iloc[0]["Downloaded"] != "✔":
-                    all_done = False; break
-            if all_done: break
-            time.sleep(1.0)
-
-        if self.stop_flag: return
-
-        # 2. EXTRACTION
-        self.log_to_console("Auto Mode: Downloads complete. Starting extraction...", "INFO")
-        self.after(0, lambda: self.extract_selected(items=selected_data))
-        
-        # Wait for extraction status update in data_df
-        while not self.stop_flag:
-            all_done = True
-            for data in selected_data:
-                row = self.data_df[self.data_df["key"] == data["key"]]
-                if not row.empty and row.iloc[0]["Extracted"] != "✔":
-                    all_done = False; break
-            if all_done: break
-            time.sleep(1.0)
+        self.after(1000, self.auto_mode_poll, selected_data, "Downloaded")
 
-        if self.stop_flag: return
-
-        # 3. CONVERSION
-        self.log_to_console("Auto Mode: Extraction complete. Starting conversion...", "INFO")
-        self.after(0, lambda: self.convert_selected(items=selected_data))
-        
-        while not self.stop_flag:
-            all_done = True
-            for data in selected_data:
-                row = self.data_df[self.data_df["key"] == data["key"]]
-                if not row.empty and row.iloc[0]["Processed"] != "✔":
-                    all_done = False; break
-            if all_done: break
-            time.sleep(1.0)
+    def auto_mode_poll(self, selected_data, stage):
+        """
+        Auto Mode state machine, driven by self.after: waits until every selected
+        row has ✔ in the `stage` column, then starts the next step.
+        Download -> "Downloaded" -> Extract -> "Extracted" -> Convert -> "Processed".
+        """
+        if self.stop_event.is_set():
+            return
 
-        if self.stop_flag: return
+        for data in selected_data:
+            idx = self.row_for_url(data["url"])
+            if idx is not None and self.data_df.at[idx, stage] != "✔":
+                self.after(1000, self.auto_mode_poll, selected_data, stage)
+                return
 
-        self.log_to_console("Auto Mode: All operations completed successfully!", "SUCCESS")
-        self.after(0, lambda: self.show_centered_popup("Auto Mode", "All operations completed successfully!", "info"))
-        self.auto_mode_start_time = None
-    def extract_gz_file_with_progress(self, file_path: Path, callback):
+        if stage == "Downloaded":
+            # 2. EXTRACTION
+            self.log_to_console("Auto Mode: Downloads complete. Starting extraction...", "INFO")
+            self.extract_selected(items=selected_data)
+            self.after(1000, self.auto_mode_poll, selected_data, "Extracted")
+        elif stage == "Extracted":
+            # 3. CONVERSION
+            self.log_to_console("Auto Mode: Extraction complete. Starting conversion...", "INFO")
+            self.convert_selected(items=selected_data)
+            self.after(1000, self.auto_mode_poll, selected_data, "Processed")
+        else:
+            self.log_to_console("Auto Mode: All operations completed successfully!", "SUCCESS")
+            self.show_centered_popup("Auto Mode", "All operations completed successfully!", "info")
+            self.auto_mode_start_time = None
+    def extract_gz_file_with_progress(self, file_path: Path, callback, show_progress=True):
         """
         Verilen .gz dosyasını çıkartır ve ilerleme durumunu UI’ye yansıtır.
         İşlem tamamlandığında veya iptal/hata durumunda callback(True) veya callback(False) çağrılır.
+        show_progress=False leaves the progress bar and time labels to the caller
+        (several files extracting at once).
         """
         import time
         from datetime import datetime
@@ -2178,99 +3019,170 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
         output_path = file_path.with_suffix('')
         total_size = file_path.stat().st_size
+        # With a usable ISIZE, progress follows bytes written (linear) rather than
+        # the compressed offset, whose rate changes with the deflate ratio
+        uncompressed_total = gzip_uncompressed_size(file_path, total_size)
         progress_queue = queue.Queue()
         start_time = datetime.now()
-        self.prog_time_started_var.set(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        start_mono = time.monotonic()
+        if show_progress:
+            self.prog_time_started_var.set(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Last values pushed to the widgets, so unchanged ticks skip the redraw
+        last_shown_pct = None
+        last_shown_secs = None
+
+        stop_event = self.stop_event  # local alias for the read loop
+        finished = False
+
+        def post(message):
+            """Queue a worker message and wake the Tk loop to handle it (no polling)."""
+            progress_queue.put(message)
+            self.after(0, update_progress)
+
+        # Without rapidgzip, a pigz process on Linux does the inflating outside Python
+        # (no GIL sharing with the Tk loop); progress comes from its input offset in /proc
+        pigz = shutil.which("pigz") if rapidgzip is None and sys.platform.startswith("linux") else None
+
+        def extract_with_pigz(temp_output_path):
+            """Runs pigz -dc into temp_output_path; returns False if stopped by the user."""
+            last_pct = -EXTRACT_PROGRESS_STEP
+            with open(temp_output_path, 'wb') as f_out:
+                proc = subprocess.Popen([pigz, "-dc", str(file_path)], stdout=f_out, stderr=subprocess.PIPE)
+            while proc.poll() is None:
+                if stop_event.wait(0.2):
+                    proc.terminate()
+                    proc.wait()
+                    return False
+                written = os.stat(temp_output_path).st_size if uncompressed_total else None
+                if written is not None and written <= uncompressed_total:
+                    percent = written / uncompressed_total * 100
+                else:
+                    compressed_pos = process_read_position(proc.pid, file_path)
+                    if compressed_pos is None:
+                        continue
+                    percent = (compressed_pos / total_size) * 100 if total_size else 0
+                if int(percent * 10) - last_pct >= EXTRACT_PROGRESS_STEP:
+                    last_pct = int(percent * 10)
+                    post(('progress', percent))
+            error = proc.stderr.read().decode(errors='replace').strip()
+            proc.stderr.close()
+            if proc.returncode != 0:
+                raise RuntimeError(f"pigz exited with {proc.returncode}: {error}")
+            return True
 
         def extract_worker():
             try:
                 temp_output_path = output_path.with_suffix('.xml.tmp')
-                with gzip.open(file_path, 'rb') as f_in, open(temp_output_path, 'wb') as f_out:
+                last_pct = -EXTRACT_PROGRESS_STEP  # in tenths of a percent
+                if pigz is not None:
+                    if not extract_with_pigz(temp_output_path):
+                        post(('stopped', None))
+                        return
+                    os.replace(temp_output_path, output_path)
+                    drop_from_page_cache(file_path)
+                    post(('done', None))
+                    return
+                if rapidgzip is not None:
+                    # Decompresses independent deflate blocks on all cores
+                    f_in = open_rapidgzip(file_path)
+                    read_size = RAPIDGZIP_CHUNK_MIB * 1024 * 1024
+                    compressed_tell = lambda: f_in.tell_compressed() // 8  # reported in bits
+                else:
+                    # Keep our own handle on the compressed file for cheap position probes;
+                    # isal's GzipFile (ISA-L inflate) when installed, else the stdlib one
+                    raw = open(file_path, 'rb')
+                    advise_sequential(raw.fileno())
+                    f_in = (isal_gzip or gzip).GzipFile(fileobj=raw, mode='rb')
+                    f_in.myfileobj = raw  # GzipFile closes it together with itself
+                    read_size = EXTRACT_READ_SIZE  # 8 MB'lık parça
+                    compressed_tell = raw.tell
+                # One scratch buffer for the whole file instead of a new bytes object per read
+                buf = bytearray(read_size)
+                view = memoryview(buf)
+                written = 0
+                with f_in, open(temp_output_path, 'wb') as f_out:
                     while True:
-                        if self.stop_flag:
-                            progress_queue.put(('stopped', None))
+                        if stop_event.is_set():
+                            post(('stopped', None))
                             return
-                        chunk = f_in.read(1024 * 1024)  # 1 MB'lık parça
-                        if not chunk:
+                        n = f_in.readinto(buf)
+                        if not n:
                             break
-                        f_out.write(chunk)
-                        compressed_pos = f_in.fileobj.tell()
-                        percent = (compressed_pos / total_size) * 100 if total_size else 0
-                        progress_queue.put(('progress', percent))
-                if temp_output_path.exists():
-                    temp_output_path.rename(output_path)
-                progress_queue.put(('done', None))
+                        f_out.write(view[:n])
+                        written += n
+                        # Past ISIZE (multi-member file or wrapped trailer) the compressed offset takes over
+                        if uncompressed_total and written <= uncompressed_total:
+                            percent = written / uncompressed_total * 100
+                        else:
+                            percent = (compressed_tell() / total_size) * 100 if total_size else 0
+                        # Queue a message only once progress moved by EXTRACT_PROGRESS_STEP
+                        if int(percent * 10) - last_pct >= EXTRACT_PROGRESS_STEP:
+                            last_pct = int(percent * 10)
+                            post(('progress', percent))
+                    if rapidgzip is not None:
+                        save_rapidgzip_index(f_in, file_path)
+                # Atomic on every platform, also when output_path already exists
+                os.replace(temp_output_path, output_path)
+                # The .gz is not read again; the fresh XML stays cached for the conversion step
+                drop_from_page_cache(file_path)
+                post(('done', None))
             except Exception as e:
-                progress_queue.put(('error', str(e)))
+                post(('error', str(e)))
 
 
         def update_progress():
-            try:
-                while True:
-                    msg_type, value = progress_queue.get_nowait()
-                    if msg_type == 'progress':
-                        self.pb["value"] = value
-                        self.prog_message_var.set(f'Extracting: {value:.1f}%')
-                    elif msg_type == 'done':
+            nonlocal last_shown_pct, finished
+            if finished:
+                return
+            # Only the newest 'progress' value matters; older ones would be overwritten anyway
+            last_progress = None
+            for msg_type, value in drain_queue(progress_queue):
+                if msg_type == 'progress':
+                    last_progress = value
+                elif msg_type == 'done':
+                    finished = True
+                    if show_progress:
                         self.pb["value"] = 100
                         self.prog_message_var.set('Extraction completed')
-                    elif msg_type == 'stopped':
-                        self.pb["value"] = 0
-                        self.prog_message_var.set('Extraction stopped')
-                        temp_output_path = output_path.with_suffix('.xml.tmp')
-                        if temp_output_path.exists():
-                            temp_output_path.unlink()
-                            self.log_to_console(f"Deleted temporary file: {temp_output_path}", "INFO")
-                        if output_path.exists():
-                            output_path.unlink()
-                            self.log_to_console(f"Deleted incomplete XML file: {output_path}", "INFO")
-                        callback(False)
-                        return
-                    elif msg_type == 'error':
-                        self.log_to_console(f"Error extracting {file_path}: {value}", "ERROR")
-                        callback(False)
-                        return
-            except queue.Empty:
-                pass
+                        update_elapsed()
+                    callback(True)
+                    return
+                elif msg_type == 'stopped':
+                    finished = True
+                    self.pb["value"] = 0
+                    self.prog_message_var.set('Extraction stopped')
+                    self.purge(output_path.with_suffix('.xml.tmp'), output_path)
+                    callback(False)
+                    return
+                elif msg_type == 'error':
+                    finished = True
+                    self.log_to_console(f"Error extracting {file_path}: {value}", "ERROR")
+                    callback(False)
+                    return
 
-            elapsed = datetime.now() - start_time
-            mins = int(elapsed.total_seconds()) // 60
-            secs = int(elapsed.total_seconds()) % 60
-            self.prog_time_elapsed_var.set(f"Elapsed: {mins} min {secs} sec")
+            if show_progress and last_progress is not None and round(last_progress, 1) != last_shown_pct:
+                last_shown_pct = round(last_progress, 1)
+                self.pb["value"] = last_progress
+                self.prog_message_var.set(f'Extracting: {last_progress:.1f}%')
 
-            if not extraction_thread.is_alive():
-                # Extraction thread tamamlandıysa (hata ya da iptal olmadıysa)
-                callback(True)
-            else:
-                self.after(100, update_progress)
+        def update_elapsed():
+            nonlocal last_shown_secs
+            elapsed_secs = int(time.monotonic() - start_mono)
+            if elapsed_secs != last_shown_secs:
+                last_shown_secs = elapsed_secs
+                self.prog_time_elapsed_var.set(f"Elapsed: {elapsed_secs // 60} min {elapsed_secs % 60} sec")
+
+        def tick_elapsed():
+            # Only the elapsed label runs on a timer; progress arrives through post()
+            if not finished:
+                update_elapsed()
+                self.after(1000, tick_elapsed)
 
         extraction_thread = Thread(target=extract_worker)
         extraction_thread.start()
-        update_progress()
-
-    def get_auto_convert_items(self):
-        """
-        Auto Mode açıkken, treeview'de Downloaded sütununda "✔", Extracted sütununda "✔" olup
-        Processed sütununda henüz "✔" olmayan öğeleri döner.
-        """
-        auto_items = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item, "values")
-            if values[4] == "✔" and values[5] == "✔" and values[6] != "✔":
-                auto_items.append(item)
-        return auto_items
-
-    def get_auto_extract_items(self):
-        """
-        Auto Mode aktifken, treeview'de Downloaded sütununda "✔" olup Extracted sütununda henüz "✔" olmayan öğeleri döner.
-        """
-        auto_items = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item, "values")
-            # Değer sırası: ["", month, content, size, Downloaded, Extracted, Processed]
-            if values[4] == "✔" and values[5] != "✔":
-                auto_items.append(item)
-        return auto_items
+        if show_progress:
+            tick_elapsed()
 
     def extract_selected(self, items=None):
         # 1) Get items either from parameter or from check_vars
@@ -2278,7 +3190,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
             # Assume items is already a list of dictionaries with 'url', 'key', 'month'
             data_to_extract = items
         else:
-            checked_items = [item for item, var in self.check_vars.items() if var.get() == 1]
+            checked_items = self.checked_item_ids()
             if not checked_items:
                 self.log_to_console("No file selected for extraction!", "WARNING")
                 if not self.auto_mode_var.get():
@@ -2289,167 +3201,121 @@ class DiscogsDataProcessorUI(ttk.Frame):
             data_to_extract = []
             for item in checked_items:
                 try:
-                    v = self.tree.item(item, "values")
-                    month_val, content_val = v[1], v[2]
-                    row_data = self.data_df[(self.data_df["month"] == month_val) & (self.data_df["content"] == content_val)]
-                    if not row_data.empty:
+                    row = self.row_for_item(item)
+                    if row is not None:
                         data_to_extract.append({
-                            "url": row_data["URL"].values[0],
-                            "key": row_data["key"].values[0],
-                            "month": row_data["month"].values[0]
+                            "url": row["URL"],
+                            "key": row["key"],
+                            "month": row["month"]
                         })
                 except Exception as e:
                     self.log_to_console(f"CAPTURE ERROR: {e}", "ERROR")
 
         # 2) Check if all files are downloaded
         for data in data_to_extract:
-            row = self.data_df[self.data_df["key"] == data["key"]]
-            if not row.empty and row.iloc[0]["Downloaded"] != "✔":
+            idx = self.row_for_url(data["url"])
+            if idx is not None and self.data_df.at[idx, "Downloaded"] != "✔":
                 self.log_to_console(f"Cannot extract {data['key']} - not downloaded.", "ERROR")
                 self.show_centered_popup("Extraction Error", "You cannot extract a file that is not downloaded!", "error")
                 return
 
+        self.stop_event.clear()
         self.log_to_console("Starting extraction of selected file(s)...", "INFO")
         self.prog_message_var.set('Preparing extraction...')
-        self.after(2000, lambda: self.extract_selected_thread(data_to_extract))
+        self.after_idle(self.extract_selected_thread, data_to_extract)
 
     def extract_selected_thread(self, data_list):
         self.start_status_indicator()
         self.prog_message_var.set('Extracting now...')
         extracted_files = []
         items_to_process = list(data_list)
+        total_files = len(items_to_process)
+
+        # Several .gz files run side by side unless rapidgzip already uses every core.
+        # Everything below runs on the Tk thread (callbacks come through after()),
+        # so the counters and data_df updates need no lock.
+        max_running = 1 if rapidgzip is not None else min(EXTRACT_PARALLEL_FILES, total_files)
+        parallel = max_running > 1
+        running = 0
+        completed = 0
+        start_mono = time.monotonic()
+
+        def file_finished():
+            nonlocal completed
+            completed += 1
+            if parallel:
+                # Per-file percentages would fight over one bar; show N of M instead
+                self.pb["value"] = completed / total_files * 100
+                self.prog_message_var.set(f'Extracted {completed} of {total_files} files')
+                elapsed_secs = int(time.monotonic() - start_mono)
+                self.prog_time_elapsed_var.set(f"Elapsed: {elapsed_secs // 60} min {elapsed_secs % 60} sec")
 
         def process_next_item():
-            if not items_to_process:
-                self.populate_table(self.data_df)
-                self.stop_status_indicator()
-
-                if not self.auto_mode_var.get():
-                    if extracted_files:
-                        message = f"Successfully extracted {len(extracted_files)} files"
-                    else:
-                        message = "No files were extracted"
-                    self.show_centered_popup("Extraction Completed", message, "info")
+            if self.stop_event.is_set():
+                # Stop: queued files are never started; their worker would only see the
+                # flag and purge output_path, i.e. an already extracted .xml
+                items_to_process.clear()
+            while items_to_process and running < max_running:
+                start_item(items_to_process.pop(0))
+            if items_to_process or running:
                 return
 
-            data = items_to_process.pop(0)
+            self.populate_table(self.data_df)
+            self.stop_status_indicator()
+
+            # stop_download already told the user; no completion popup after a Stop
+            if not self.auto_mode_var.get() and not self.stop_event.is_set():
+                if extracted_files:
+                    message = f"Successfully extracted {len(extracted_files)} files"
+                else:
+                    message = "No files were extracted"
+                self.show_centered_popup("Extraction Completed", message, "info")
+
+        def start_item(data):
+            nonlocal running
             # Use data directly from the dictionary (captured on main thread)
             url = data["url"]
             key = data["key"]
             folder_name = data["month"]
             filename = os.path.basename(key)
-            file_path = Path(self.download_dir_var.get()) / "Datasets" / folder_name / filename
+            file_path = self.datasets_dir() / folder_name / filename
 
             if file_path.suffix.lower() == ".gz":
-                self.prog_current_file_var.set(f"File: {file_path.name}")
+                if not parallel:
+                    self.prog_current_file_var.set(f"File: {file_path.name}")
 
                 def extraction_callback(success):
+                    nonlocal running
+                    running -= 1
                     if success:
                         output_path = file_path.with_suffix('')
                         extracted_files.append(output_path)
                         self.log_to_console(f"Extracted: {file_path} → {output_path}", "INFO")
-                        self.data_df.loc[self.data_df["URL"] == url, "Extracted"] = "✔"
-                        self.data_df.loc[self.data_df["URL"] == url, "Processed"] = "✖"
+                        self.set_row_status(url, Extracted="✔", Processed="✖")
                     else:
                         self.log_to_console(f"Error extracting {file_path}.", "ERROR")
+                    file_finished()
                     self.after(0, process_next_item)
 
-                self.extract_gz_file_with_progress(file_path, extraction_callback)
+                running += 1
+                self.extract_gz_file_with_progress(file_path, extraction_callback,
+                                                   show_progress=not parallel)
+                return
+            if file_path.suffix.lower() == ".xml" and file_path.exists():
+                # Already uncompressed: the file itself is the extraction output, no copy needed
+                extracted_files.append(file_path)
+                self.log_to_console(f"{file_path} is already XML; nothing to extract.", "INFO")
+                self.set_row_status(url, Extracted="✔")
             else:
                 self.log_to_console(f"{file_path} not a gzipped file; skipping.", "WARNING")
-                self.after(0, process_next_item)
+            file_finished()
 
+        if parallel:
+            self.pb["value"] = 0
+            self.prog_current_file_var.set(f"File: {total_files} files, {max_running} at a time")
+            self.prog_time_started_var.set(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         process_next_item()
 
-    def convert_selected_auto(self, checked_items):
-        self.start_status_indicator()
-        self.prog_message_var.set('Automatic conversion starting...')
-        progress_queue = queue.Queue()
-        start_time = datetime.now()
-
-        def convert_thread():
-            for item in checked_items:
-                values = self.tree.item(item, "values")
-                month_val, content_val, size_val, _, extracted_val, processed_val = values[1:]
-
-                if extracted_val != "✔":
-                    self.log_to_console(f"{content_val} ({month_val}) not extracted; skipping conversion.", "WARNING")
-                    continue
-
-                if processed_val == "✔":
-                    self.log_to_console(f"{content_val} ({month_val}) already processed; skipping.", "INFO")
-                    continue
-
-                row_data = self.data_df[
-                    (self.data_df["month"] == month_val) &
-                    (self.data_df["content"] == content_val) &
-                    (self.data_df["size"] == size_val)
-                    ]
-                if row_data.empty:
-                    continue
-
-                url = row_data["URL"].values[0]
-                key = row_data["key"].values[0]
-                folder_name = row_data["month"].values[0]
-                filename = os.path.basename(key)
-                extracted_file = (Path(self.download_dir_var.get()) / "Datasets" / folder_name / filename).with_suffix(
-                    "")
-
-                chunk_folder = extracted_file.parent / f"chunked_{content_val}"
-                combined_csv = extracted_file.with_suffix(".csv")
-
-                try:
-                    self.log_to_console(f"Chunking {extracted_file.name}...", "INFO")
-                    chunk_xml_by_type(extracted_file, content_val, logger=self.log_to_console)
-
-                    self.log_to_console(f"Converting {chunk_folder.name} to CSV...", "INFO")
-                    convert_chunked_files_to_csv(chunk_folder, combined_csv, content_val, logger=self.log_to_console)
-
-                    shutil.rmtree(chunk_folder, ignore_errors=True)
-                    self.data_df.loc[self.data_df["URL"] == url, "Processed"] = "✔"
-                    self.log_to_console(f"CSV created: {combined_csv.name}", "INFO")
-                except Exception as e:
-                    self.log_to_console(f"Error converting {extracted_file.name}: {e}", "ERROR")
-
-            progress_queue.put('done')
-
-        th = Thread(target=convert_thread, daemon=True)
-        th.start()
-
-        def process_queue():
-            last_processed_file = ""  # Son işlenen dosyayı tutmak için değişken eklendi
-            try:
-                while True:
-                    msg_type, value = progress_queue.get_nowait()
-                    if msg_type == 'chunking_start':
-                        self.prog_message_var.set(f"Chunking: {value}")
-                        self.pb["value"] = 0
-                        last_processed_file = value  # Dosya adını güncelle
-                    elif msg_type == 'chunking_done':
-                        self.prog_message_var.set("Converting: Starting...")
-                        self.pb["value"] = 0
-                    elif msg_type == 'conversion_progress':
-                        self.prog_message_var.set(f"Converting: {value:.2f}%")
-                        self.pb["value"] = value
-                    elif msg_type == 'done':
-                        elapsed = datetime.now() - start_time
-                        self.log_to_console(f"Conversion completed in {elapsed}.", "INFO")
-                        self.populate_table(self.data_df)
-                        self.prog_message_var.set("Conversion completed!")
-                        self.pb["value"] = 100
-                        self.stop_status_indicator()
-
-                        # Popup mesajında son işlenen dosyanın adı
-                        popup_message = f"{last_processed_file} converted successfully!"
-                        self.show_centered_popup("Conversion Completed", popup_message, "info")
-            except queue.Empty:
-                if th.is_alive():
-                    self.after(100, process_queue)
-                else:
-                    self.stop_status_indicator()
-
-        process_queue()
-
     def show_centered_popup(self, title, message, message_type="info"):
         if message_type == "info":
             messagebox.showinfo(title, message, parent=self)
@@ -2479,14 +3345,13 @@ class DiscogsDataProcessorUI(ttk.Frame):
             for data in items:
                 filename = os.path.basename(data["key"])
                 extracted_file = (
-                    Path(self.download_dir_var.get()) / 
-                    "Datasets" / 
-                    data["month"] / 
+                    self.datasets_dir() /
+                    data["month"] /
                     filename
                 ).with_suffix('')
                 extracted_files.append(extracted_file)
         else:
-            checked_items = [item for item, var in self.check_vars.items() if var.get() == 1]
+            checked_items = self.checked_item_ids()
             if not checked_items:
                 self.log_to_console("No file selected for conversion!", "WARNING")
                 if not self.auto_mode_var.get():
@@ -2496,28 +3361,23 @@ class DiscogsDataProcessorUI(ttk.Frame):
             # Capture data on main thread and check status
             for item in checked_items:
                 try:
-                    v = self.tree.item(item, "values")
-                    month_val, content_val, size_val = v[1], v[2], v[3]
-                    
-                    if v[5] != "✔": # Extracted col
-                        self.log_to_console(f"Cannot convert {content_val} ({month_val}) - not extracted.", "ERROR")
+                    row = self.row_for_item(item)
+                    if row is None:
                         continue
 
-                    row_data = self.data_df[
-                        (self.data_df["month"] == month_val) &
-                        (self.data_df["content"] == content_val)
-                    ]
-                    if not row_data.empty:
-                        key = row_data["key"].values[0]
-                        folder_name = row_data["month"].values[0]
-                        filename = os.path.basename(key)
-                        extracted_file = (
-                            Path(self.download_dir_var.get()) /
-                            "Datasets" /
-                            folder_name /
-                            filename
-                        ).with_suffix('')
-                        extracted_files.append(extracted_file)
+                    if row["Extracted"] != "✔":
+                        self.log_to_console(f"Cannot convert {row['content']} ({row['month']}) - not extracted.", "ERROR")
+                        continue
+
+                    key = row["key"]
+                    folder_name = row["month"]
+                    filename = os.path.basename(key)
+                    extracted_file = (
+                        self.datasets_dir() /
+                        folder_name /
+                        filename
+                    ).with_suffix('')
+                    extracted_files.append(extracted_file)
                 except Exception as e:
                     self.log_to_console(f"CAPTURE ERROR: {e}", "ERROR")
 
@@ -2525,110 +3385,149 @@ class DiscogsDataProcessorUI(ttk.Frame):
             return
 
         # 4) Belirlenen extracted_files listesi üzerinden dönüştürme işlemine başla
+        # Her dosya ayrı bir process'te dönüştürülür (CPU-bound iş, GIL paylaşılmaz)
+        self.stop_event.clear()
         self.start_status_indicator()
-        progress_queue = queue.Queue()
         start_time = datetime.now()
+        manager = multiprocessing.Manager()
+        progress_queue = manager.Queue()
+        executor = ProcessPoolExecutor(max_workers=min(len(extracted_files), os.cpu_count() or 1, 4))
+
+        futures = {}
+        for extracted_file in extracted_files:
+            content_type = extracted_file.stem.split('_')[-1]
+            combined_csv = extracted_file.with_suffix(".csv")
+            self.log_to_console(f"Converting {extracted_file.name} to CSV...", "INFO")
+            # Streams the XML straight to CSV; no chunked_<content>/ folder on disk
+            future = executor.submit(process_content_type, extracted_file, combined_csv, content_type, progress_queue)
+            futures[future] = extracted_file
+
+        self.prog_message_var.set(f"Converting: {', '.join(f.name for f in extracted_files)}")
+        self.pb["value"] = 0
+        file_progress = dict.fromkeys((f.name for f in extracted_files), 0.0)
+        last_processed_file = ""
+        last_shown_text = None
 
-        def convert_thread():
-            last_processed_file = ""
-            for extracted_file in extracted_files:
-                content_type = extracted_file.stem.split('_')[-1]
-                chunk_folder = extracted_file.parent / f"chunked_{content_type}"
-                combined_csv = extracted_file.with_suffix(".csv")
+        def process_queue():
+            nonlocal last_processed_file, last_shown_text
 
+            # Finished conversions first, so their last messages are already queued below
+            for future in [f for f in futures if f.done()]:
+                extracted_file = futures.pop(future)
+                content_type = extracted_file.stem.split('_')[-1]
                 try:
-                    last_processed_file = extracted_file.name
-                    self.log_to_console(f"Chunking {last_processed_file}...", "INFO")
-                    progress_queue.put(('chunking_start', last_processed_file))
-                    chunk_xml_by_type(extracted_file, content_type, logger=self.log_to_console)
-                    progress_queue.put(('chunking_done', None))
-
-                    self.log_to_console(f"Converting {chunk_folder.name} to CSV...", "INFO")
-
-                    def progress_cb(current_step, total_steps):
-                        percent = (current_step / total_steps) * 100 if total_steps else 0
-                        progress_queue.put(('conversion_progress', percent))
-
-                    convert_chunked_files_to_csv(
-                        chunk_folder,
-                        combined_csv,
-                        content_type,
-                        logger=self.log_to_console,
-                        progress_cb=progress_cb
-                    )
+                    combined_csv = future.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    self.log_to_console(f"Error converting {extracted_file.name}: {e}", "ERROR")
+                    continue
 
-                    shutil.rmtree(chunk_folder, ignore_errors=True)
+                # tabloyu güncelle: Processed=✔
+                idx = self.row_for_month_content(extracted_file.parent.name, content_type)
+                if idx is not None:
+                    self.data_df.at[idx, "Processed"] = "✔"
+                file_progress[extracted_file.name] = 100.0
+                last_processed_file = extracted_file.name
+                self.log_to_console(f"CSV created: {combined_csv.name}", "INFO")
 
-                    # tabloyu güncelle: Processed=✔
-                    self.data_df.loc[
-                        (self.data_df["month"] == extracted_file.parent.name) &
-                        (self.data_df["content"] == content_type),
-                        "Processed"
-                    ] = "✔"
-                    self.log_to_console(f"CSV created: {combined_csv.name}", "INFO")
+            progress_changed = False
+            while True:
+                try:
+                    msg_type, value = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if msg_type == 'conversion_progress':
+                    name, percent = value
+                    file_progress[name] = percent
+                    progress_changed = True
+                elif msg_type == 'log':
+                    self.log_to_console(*value)
+
+            if progress_changed and futures:
+                overall = sum(file_progress.values()) / len(file_progress)
+                # StringVar.set always issues a Tcl write; skip it when the text is unchanged
+                text = f"Converting: {overall:.2f}%"
+                if text != last_shown_text:
+                    last_shown_text = text
+                    self.prog_message_var.set(text)
+                    self.pb["value"] = overall
+
+            if futures:
+                if self.stop_event.is_set():
+                    # Queued conversions are dropped; running ones finish their file
+                    executor.shutdown(wait=False, cancel_futures=True)
+                self.after(100, process_queue)
+                return
 
-                except Exception as e:
-                    self.log_to_console(f"Error converting {extracted_file.name}: {e}", "ERROR")
+            executor.shutdown(wait=False)
+            manager.shutdown()
 
-            progress_queue.put(('done', last_processed_file))
+            elapsed = datetime.now() - start_time
+            self.log_to_console(f"Conversion completed in {elapsed}.", "INFO")
 
-        th = Thread(target=convert_thread, daemon=True)
-        th.start()
+            # TABLO GÜNCELLE
+            self.populate_table(self.data_df)
 
-        def process_queue():
-            try:
-                while True:
-                    msg_type, value = progress_queue.get_nowait()
-                    if msg_type == 'chunking_start':
-                        self.prog_message_var.set(f"Chunking: {value}")
-                        self.pb["value"] = 0
-                    elif msg_type == 'chunking_done':
-                        self.prog_message_var.set("Converting: Starting...")
-                        self.pb["value"] = 0
-                    elif msg_type == 'conversion_progress':
-                        self.prog_message_var.set(f"Converting: {value:.2f}%")
-                        self.pb["value"] = value
-                    elif msg_type == 'done':
-                        elapsed = datetime.now() - start_time
-                        self.log_to_console(f"Conversion completed in {elapsed}.", "INFO")
-
-                        # TABLO GÜNCELLE
-                        self.populate_table(self.data_df)
-
-                        self.prog_message_var.set("Conversion completed")
-                        self.pb["value"] = 100
-                        self.stop_status_indicator()
-
-                        # STOP İLE İPTAL EDİLDİ Mİ KONTROLÜ
-                        if not self.stop_flag:
-                            # Sadece stop_flag = False ise başarı popup'ı göster
-                            popup_message = f"{value} converted successfully!"
-                            self.show_centered_popup("Conversion Completed", popup_message, "info")
-                    # while True döngüsü devam
-            except queue.Empty:
-                if th.is_alive():
-                    self.after(100, process_queue)
-                else:
-                    self.stop_status_indicator()
+            self.prog_message_var.set("Conversion completed")
+            self.pb["value"] = 100
+            self.stop_status_indicator()
+
+            # STOP İLE İPTAL EDİLDİ Mİ KONTROLÜ
+            if not self.stop_event.is_set():
+                # Sadece stop_event set edilmemişse başarı popup'ı göster
+                popup_message = f"{last_processed_file} converted successfully!"
+                self.show_centered_popup("Conversion Completed", popup_message, "info")
 
         # process_queue çağrısı
         process_queue()
 
     def get_folder_size(self, folder_path):
+        """Total size of all files under folder_path (one stat per entry via scandir)."""
         total_size = 0
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
+        try:
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            total_size += self.get_folder_size(entry.path)
+                    except OSError:
+                        # File vanished mid-scan (e.g. a .part file being merged)
+                        continue
+        except OSError:
+            pass
         return total_size
 
     def update_downloaded_size(self):
-        downloads_dir = Path(self.download_dir_var.get())
-        if not downloads_dir.exists():
-            self.downloaded_size_var.set("→ 0 MB")
+        """
+        Debounced: many callers fire this back to back (populate_table, downloads,
+        deletes), so only one folder scan runs per second.
+        """
+        if self.size_update_after_id is not None:
             return
-        size_in_bytes = self.get_folder_size(downloads_dir)
+        self.size_update_after_id = self.after(1000, self._refresh_downloaded_size)
+
+    def _refresh_downloaded_size(self):
+        self.size_update_after_id = None
+        if self.size_scan_running:
+            # One scan at a time; run another once the current one reports back
+            self.size_rescan_pending = True
+            return
+        self.size_scan_running = True
+        # The walk can touch thousands of files: keep it off the Tk thread
+        Thread(target=self._scan_downloaded_size, args=(self.download_root(),), daemon=True).start()
+
+    def _scan_downloaded_size(self, downloads_dir):
+        size_in_bytes = self.get_folder_size(downloads_dir)  # 0 if the folder is missing
+        self.after(0, self._show_downloaded_size, size_in_bytes)
+
+    def _show_downloaded_size(self, size_in_bytes):
+        self.size_scan_running = False
+        if self.size_rescan_pending:
+            self.size_rescan_pending = False
+            self.update_downloaded_size()
         one_gb = 1024 ** 3
         if size_in_bytes >= one_gb:
             size_in_gb = size_in_bytes // one_gb
@@ -2638,7 +3537,7 @@ class DiscogsDataProcessorUI(ttk.Frame):
             self.downloaded_size_var.set(f"→ {size_in_mb} MB")
 
     def open_discogs_folder(self):
-        downloads_dir = Path(self.download_dir_var.get())
+        downloads_dir = self.download_root()
         if not downloads_dir.exists():
             self.log_to_console(f"{downloads_dir} folder not found!", "ERROR")
             messagebox.showerror("Error", f"{downloads_dir} folder not found!")
@@ -2656,17 +3555,52 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
     def save_to_file(self):
         try:
-            downloads_dir = Path(self.download_dir_var.get())
+            downloads_dir = self.download_root()
             downloads_dir.mkdir(parents=True, exist_ok=True)
             file_path = downloads_dir / "discogs_data.csv"
             self.data_df.to_csv(file_path, sep="\t", index=False)
             self.log_to_console(f"Data saved as {file_path}.")
+            if pa is not None:
+                # Typed columnar copy for load_listing_snapshot; the CSV above stays the user-facing export
+                snapshot = self.listing_snapshot_path()
+                snapshot.parent.mkdir(parents=True, exist_ok=True)
+                self.data_df.to_parquet(snapshot, engine="pyarrow", compression="zstd", index=False)
         except Exception as e:
             self.log_to_console(f"Error: {e}", "ERROR")
 
+    def listing_snapshot_path(self):
+        return self.download_root() / "listing_cache" / "listing.parquet"
+
+    def load_listing_snapshot(self):
+        """Fill the table from the Parquet snapshot written by save_to_file, if there is one."""
+        if pa is None:
+            return
+        snapshot = self.listing_snapshot_path()
+        try:
+            data_df = pd.read_parquet(snapshot, engine="pyarrow")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.log_to_console(f"Could not read saved listing {snapshot}: {e}", "WARNING")
+            return
+        if data_df.empty:
+            return
+        # Files may have been added or removed since the snapshot was written
+        self.data_df = self.mark_downloaded_files(data_df)
+        self.populate_table(self.data_df)
+
     def start_scraping(self):
+        if self.scrape_running:
+            self.log_to_console("Fetching data is already in progress.", "INFO")
+            return
+        self.scrape_running = True
+        self.listing_generation += 1
         self.log_to_console("Fetching data, please wait...", "INFO")
-        Thread(target=self._scrape_data_s3, daemon=True).start()
+        # Fill the folder cache here, so refresh_statuses on the worker never reads download_dir_var
+        self.datasets_dir()
+        Thread(target=self._scrape_data_s3,
+               args=(self.scrape_year_var.get(), self.download_dir_var.get(), self.listing_generation),
+               daemon=True).start()
 
 
     def start_status_indicator(self):
@@ -2693,13 +3627,13 @@ class DiscogsDataProcessorUI(ttk.Frame):
 
 def main():
     import sys
-    empty_df = pd.DataFrame(columns=[
-        "month", "content", "size", "last_modified", "key", "URL",
-        "Downloaded", "Extracted", "Processed"
-    ])
-    empty_df["Downloaded"] = "✖"
-    empty_df["Extracted"] = "✖"
-    empty_df["Processed"] = "✖"
+    # Column dtypes set up front; no per-column assignment on the empty frame
+    empty_df = pd.DataFrame({
+        **{col: pd.array([], dtype=LISTING_STR_DTYPE)
+           for col in ["month", "content", "size", "last_modified", "key", "URL"]},
+        **{col: pd.Categorical([], dtype=STATUS_DTYPE)
+           for col in ["Downloaded", "Extracted", "Processed"]},
+    })
 
     app = ttk.Window("Discogs Data Processor", themename="darkly")
     primary_color = app.style.colors.primary
@@ -2730,4 +3664,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller: Pool workers re-enter the frozen executable
     main()
\ No newline at end of file